@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+from memory_mcp.schema import TIMESTAMP_FORMAT
+
 # -- Action type constants ----------------------------------------------------
 
 ACTION_MERGE = "merge"
@@ -26,7 +28,7 @@ VALID_ACTION_TYPES = frozenset(
 
 def _now_utc() -> str:
     """ISO 8601 UTC timestamp with Z suffix."""
-    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    return datetime.now(UTC).strftime(TIMESTAMP_FORMAT)
 
 
 def _resolve_entry(memories: dict, category: str, key: str) -> dict | None:
@@ -123,7 +123,7 @@ def _find_dedup_candidates(
                     "category": category,
                     "key": existing_key,
                     "value": entry.get("value", ""),
-                    "tags": existing_tags,
+                    "tags": list(existing_tags),
                     "match_reason": ", ".join(reasons),
                     "tag_overlap": tag_overlap,
                     "value_similarity": round(similarity, 2),
@@ -6,7 +6,7 @@ import collections
 from datetime import UTC, datetime
 
 from memory_mcp.observations import ObservationStore
-from memory_mcp.schema import VALID_CATEGORIES
+from memory_mcp.schema import TIMESTAMP_FORMAT, VALID_CATEGORIES
 
 # Bare tool names for all memory MCP operations.
 _MEMORY_TOOL_NAMES = frozenset(
@@ -58,7 +58,7 @@ def compute_metrics(
         Structured metrics dict with summary_markdown for display.
     """
     memories = data.get("memories", {})
-    now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    now = datetime.now(UTC).strftime(TIMESTAMP_FORMAT)
 
     store_metrics = _compute_store_metrics(memories, now)
     obs_metrics = _compute_observation_metrics(obs_store) if obs_store else {}
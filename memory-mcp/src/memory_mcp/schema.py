@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 
 # -- Constants ----------------------------------------------------------------
 
 SCHEMA_VERSION = "2.0"
 
+# ISO 8601 UTC with fixed-width microseconds, e.g. 2026-01-01T00:00:00.000000Z
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
 VALID_CATEGORIES = ("user", "assistant", "project", "relationships", "tools", "learnings")
 
 VALID_TYPES = (
@@ -26,6 +30,11 @@ VALID_SOURCE_TYPES = ("session", "user-stated", "inferred", "codebase")
 
 VALID_RELATIONS = ("supersedes", "elaborates", "contradicts", "related-to", "depends-on")
 
+# Hashed views for membership checks. The tuples above stay canonical: their
+# order drives memory.json category layout, error messages, and server schemas.
+VALID_CATEGORY_SET = frozenset(VALID_CATEGORIES)
+VALID_RELATION_SET = frozenset(VALID_RELATIONS)
+
 DEFAULT_IMPORTANCE = 5
 MIN_IMPORTANCE = 1
 MAX_IMPORTANCE = 10
@@ -56,7 +65,7 @@ def generate_summary(value: str, max_len: int = SUMMARY_MAX_LENGTH) -> str:
 # -- Dataclasses --------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Source:
     """Origin metadata for a memory entry."""
 
@@ -77,16 +86,47 @@ class Source:
 
     @classmethod
     def from_dict(cls, data: dict) -> Source:
-        return cls(
-            type=data.get("type", "session"),
-            detail=data.get("detail"),
-            agent_type=data.get("agent_type"),
-            agent_id=data.get("agent_id"),
-            session_id=data.get("session_id"),
+        if not data:
+            return _DEFAULT_SOURCE
+        get = data.get
+        return _intern_source(
+            get("type", "session"),
+            get("detail"),
+            get("agent_type"),
+            get("agent_id"),
+            get("session_id"),
         )
 
 
-@dataclass(frozen=True)
+# Shared default origin. Source is frozen, so one instance can back every
+# entry that has no explicit source instead of allocating one per entry.
+_DEFAULT_SOURCE = Source()
+
+
+@functools.lru_cache(maxsize=256)
+def _intern_source(
+    source_type: str = "session",
+    detail: str | None = None,
+    agent_type: str | None = None,
+    agent_id: str | None = None,
+    session_id: str | None = None,
+) -> Source:
+    """Return a shared ``Source`` for these field values.
+
+    Most entries repeat a handful of origins, so interning lets them share
+    one frozen instance. The LRU bound keeps per-session ids from growing
+    the cache without limit.
+    """
+    return Source(
+        type=source_type,
+        detail=detail,
+        agent_type=agent_type,
+        agent_id=agent_id,
+        session_id=session_id,
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Link:
     """A unidirectional link from one memory entry to another."""
 
@@ -101,7 +141,7 @@ class Link:
         return cls(target=data["target"], relation=data["relation"])
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """A single memory entry with v2.0 schema fields."""
 
@@ -111,7 +151,7 @@ class MemoryEntry:
     tags: list[str] = field(default_factory=list)
     confidence: float | None = None
     importance: int = DEFAULT_IMPORTANCE
-    source: Source = field(default_factory=Source)
+    source: Source = _DEFAULT_SOURCE
     access_count: int = 0
     last_accessed: str | None = None
     status: str = "active"
@@ -134,7 +174,8 @@ class MemoryEntry:
             "access_count": self.access_count,
             "last_accessed": self.last_accessed,
             "status": self.status,
-            "links": [link.to_dict() for link in self.links],
+            # Link.to_dict inlined: one fewer method call per link on this hot path
+            "links": [{"target": lk.target, "relation": lk.relation} for lk in self.links],
             "summary": self.summary,
             "valid_at": self.valid_at,
             "invalid_at": self.invalid_at,
@@ -144,25 +185,27 @@ class MemoryEntry:
 
     @classmethod
     def from_dict(cls, data: dict) -> MemoryEntry:
-        source_data = data.get("source", {"type": "session", "detail": None})
-        links_data = data.get("links", [])
+        # Bind the lookup once and default missing containers to shared
+        # immutable empties, so absent fields cost no allocation.
+        get = data.get
+        source_data = get("source")
         return cls(
             value=data["value"],
             created_at=data["created_at"],
             updated_at=data["updated_at"],
-            tags=list(data.get("tags", [])),
-            confidence=data.get("confidence"),
-            importance=data.get("importance", DEFAULT_IMPORTANCE),
-            source=Source.from_dict(source_data),
-            access_count=data.get("access_count", 0),
-            last_accessed=data.get("last_accessed"),
-            status=data.get("status", "active"),
-            links=[Link.from_dict(ld) for ld in links_data],
-            summary=data.get("summary", ""),
-            valid_at=data.get("valid_at"),
-            invalid_at=data.get("invalid_at"),
-            type=data.get("type"),
-            created_by=data.get("created_by"),
+            tags=list(get("tags", ())),
+            confidence=get("confidence"),
+            importance=get("importance", DEFAULT_IMPORTANCE),
+            source=Source.from_dict(source_data) if source_data else _DEFAULT_SOURCE,
+            access_count=get("access_count", 0),
+            last_accessed=get("last_accessed"),
+            status=get("status", "active"),
+            links=[Link.from_dict(ld) for ld in get("links", ())],
+            summary=get("summary", ""),
+            valid_at=get("valid_at"),
+            invalid_at=get("invalid_at"),
+            type=get("type"),
+            created_by=get("created_by"),
         )
 
 
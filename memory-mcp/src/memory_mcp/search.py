@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import math
 from datetime import datetime
+from typing import NamedTuple
 
 from memory_mcp.schema import DEFAULT_IMPORTANCE, MAX_IMPORTANCE
 
@@ -27,35 +29,52 @@ SEARCH_WEIGHTS = {
 RECENCY_DECAY_DAYS = 30
 
 
+# -- Searchable text ----------------------------------------------------------
+
+
+class _EntryText(NamedTuple):
+    """Lower-cased searchable fields of one entry.
+
+    Built once per entry per search so matching and scoring share the
+    lowering work instead of each re-lowering key, value, and tags.
+    """
+
+    key: str
+    value: str
+    summary: str
+    tags: list[str]
+
+
+def _entry_text(key: str, entry: dict) -> _EntryText:
+    return _EntryText(
+        key=key.lower(),
+        value=entry.get("value", "").lower(),
+        summary=entry.get("summary", "").lower(),
+        tags=[t.lower() for t in entry.get("tags", [])],
+    )
+
+
 # -- Scoring functions --------------------------------------------------------
 
 
-def _compute_text_match_score(
-    key: str,
-    entry: dict,
-    query_lower: str,
-) -> float:
+def _compute_text_match_score(text: _EntryText, query_lower: str) -> float:
     """Score text match: 1.0 for exact key, 0.7 for key substring, 0.5 for value/tag match."""
-    if key.lower() == query_lower:
+    if text.key == query_lower:
         return 1.0
-    if query_lower in key.lower():
+    if query_lower in text.key:
         return 0.7
-    if query_lower in entry.get("value", "").lower():
+    if query_lower in text.value:
         return 0.5
-    tags = entry.get("tags", [])
-    if any(query_lower in tag.lower() for tag in tags):
+    if any(query_lower in tag for tag in text.tags):
         return 0.5
     return 0.0
 
 
-def _compute_tag_match_score(entry: dict, query_terms: list[str]) -> float:
+def _compute_tag_match_score(text: _EntryText, query_terms: list[str]) -> float:
     """Fraction of entry tags that match any query term."""
-    if not query_terms:
-        return 0.0
-    tags_lower = {t.lower() for t in entry.get("tags", [])}
-    if not tags_lower:
+    if not query_terms or not text.tags:
         return 0.0
-    matching = sum(1 for term in query_terms if any(term in tag for tag in tags_lower))
+    matching = sum(1 for term in query_terms if any(term in tag for tag in text.tags))
     return min(matching / max(len(query_terms), 1), 1.0)
 
 
@@ -70,12 +89,20 @@ def _compute_recency_score(entry: dict, now: datetime) -> float:
     last_accessed = entry.get("last_accessed")
     if not last_accessed:
         return 0.0
-    accessed_str = last_accessed.replace("Z", "+00:00")
-    accessed_dt = datetime.fromisoformat(accessed_str)
-    days_since = (now - accessed_dt).total_seconds() / 86400
+    days_since = (now.timestamp() - _epoch_seconds(last_accessed)) / 86400
     return math.exp(-days_since / RECENCY_DECAY_DAYS)
 
 
+@functools.lru_cache(maxsize=1024)
+def _epoch_seconds(timestamp: str) -> float:
+    """Parse an ISO 8601 timestamp to epoch seconds.
+
+    Cached because access tracking stamps every entry returned by one
+    search or recall with the same string, so few distinct values recur.
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+
+
 def _compute_search_score(signals: dict[str, float]) -> float:
     """Weighted combination of individual signal scores."""
     return sum(SEARCH_WEIGHTS[signal] * score for signal, score in signals.items())
@@ -98,8 +125,7 @@ def _find_match_reasons(key: str, entry: dict, query_lower: str) -> list[str]:
 
 
 def _find_match_reasons_multi(
-    key: str,
-    entry: dict,
+    text: _EntryText,
     query_lower: str,
     query_terms: list[str],
 ) -> list[str]:
@@ -110,10 +136,7 @@ def _find_match_reasons_multi(
     matching when query_terms is empty or has a single term.
     """
     reasons: list[str] = []
-    key_lower = key.lower()
-    value_lower = entry.get("value", "").lower()
-    summary_lower = entry.get("summary", "").lower()
-    tags_lower = [t.lower() for t in entry.get("tags", [])]
+    key_lower, value_lower, summary_lower, tags_lower = text
 
     # Check whole query first (preserves backward-compatible ordering)
     if query_lower in key_lower:
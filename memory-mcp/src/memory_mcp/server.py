@@ -257,6 +257,7 @@ def search(
     include_historical: bool = False,
     since: str | None = None,
     type: str | None = None,  # noqa: A002
+    limit: int | None = None,
 ) -> dict:
     """Search memories by text across keys, values, tags, and summaries.
 
@@ -273,6 +274,7 @@ def search(
             this time are included.
         type: Optional type filter (decision, gotcha, pattern, convention,
             preference, correction, insight).
+        limit: Optional maximum number of results, highest-ranked first.
     """
     try:
         return _get_store().search(
@@ -282,6 +284,7 @@ def search(
             include_historical=include_historical,
             since=since,
             entry_type=type,
+            limit=limit,
         )
     except ValueError as exc:
         return {"error": str(exc)}
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import contextlib
 import fcntl
+import heapq
 import json
 import os
+import sys
 import tempfile
+import threading
 from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
 
 from memory_mcp.consolidation import apply_actions, validate_actions
@@ -20,10 +24,13 @@ from memory_mcp.schema import (
     MAX_IMPORTANCE,
     MIN_IMPORTANCE,
     SCHEMA_VERSION,
+    TIMESTAMP_FORMAT,
     VALID_CATEGORIES,
+    VALID_CATEGORY_SET,
+    VALID_RELATION_SET,
     VALID_RELATIONS,
     MemoryEntry,
-    Source,
+    _intern_source,
     generate_summary,
 )
 from memory_mcp.search import (
@@ -32,6 +39,7 @@ from memory_mcp.search import (
     _compute_search_score,
     _compute_tag_match_score,
     _compute_text_match_score,
+    _entry_text,
     _find_match_reasons_multi,
     _format_as_markdown,
     format_markdown_kv_index,
@@ -41,6 +49,14 @@ from memory_mcp.search import (
 # -- Constants ----------------------------------------------------------------
 
 JSON_INDENT = 2
+# Backups are write-mostly recovery snapshots, not diffed in git like memory.json,
+# so they skip indentation: smaller files and a cheaper dump on every forget.
+BACKUP_JSON_SEPARATORS = (",", ":")
+
+# Encoders are configured once and reused: json.dumps() with any non-default
+# option builds a fresh JSONEncoder on every call.
+_DOCUMENT_ENCODER = json.JSONEncoder(indent=JSON_INDENT, ensure_ascii=False)
+_BACKUP_ENCODER = json.JSONEncoder(separators=BACKUP_JSON_SEPARATORS, ensure_ascii=False)
 BACKUP_SUFFIX = ".backup.json"
 PRE_FORGET_BACKUP_SUFFIX = ".pre-forget.json"
 
@@ -54,8 +70,12 @@ AUTO_LINK_RELATION = "related-to"
 
 
 def _now_utc() -> str:
-    """ISO 8601 UTC timestamp with Z suffix."""
-    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    """ISO 8601 UTC timestamp with Z suffix.
+
+    Always carries microseconds, unlike ``isoformat()`` (which drops them when
+    zero), so stored timestamps have one width and compare correctly as strings.
+    """
+    return datetime.now(UTC).strftime(TIMESTAMP_FORMAT)
 
 
 def _clamp_importance(value: int) -> int:
@@ -91,23 +111,52 @@ class MemoryStore:
 
     def __init__(self, file_path: Path) -> None:
         self._path = Path(file_path)
-        self._ensure_file_exists()
-        self._auto_migrate_if_needed()
+        # Sibling paths derived from the store path, fixed for its lifetime.
+        self._lock_path = self._path.with_suffix(".lock")
+        self._forget_backup_path = self._path.with_name(self._path.stem + PRE_FORGET_BACKUP_SUFFIX)
+        self._delete_backup_path = self._path.with_name(self._path.stem + BACKUP_SUFFIX)
+        # Parsed document plus the (inode, mtime_ns, size) it was read from;
+        # see ``_load``.
+        self._cached_doc: dict | None = None
+        self._cached_stamp: tuple[int, int, int] | None = None
+        # Stamp and text of this store's last write; see ``_save``.
+        self._written: tuple[tuple[int, int, int], str] | None = None
+        # Thread holding the file lock, so nested acquisitions by that thread
+        # (operations inside ``batched()``) don't deadlock on flock.
+        self._lock_owner: int | None = None
+        self._in_batch = False
+        self._batch_dirty = False
+        self._batch_aborted = False
+        # A freshly created file is already at SCHEMA_VERSION -- skip re-reading it.
+        if not self._ensure_file_exists():
+            self._auto_migrate_if_needed()
 
     # -- File I/O (private) ---------------------------------------------------
 
-    def _ensure_file_exists(self) -> None:
-        if not self._path.exists():
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            empty_doc = {
-                "schema_version": SCHEMA_VERSION,
-                "session_count": 0,
-                "memories": {cat: {} for cat in VALID_CATEGORIES},
-            }
-            self._save(empty_doc)
+    def _ensure_file_exists(self) -> bool:
+        """Create an empty current-version store if missing. Returns True if created."""
+        if self._path.exists():
+            return False
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        empty_doc = {
+            "schema_version": SCHEMA_VERSION,
+            "session_count": 0,
+            "memories": {cat: {} for cat in VALID_CATEGORIES},
+        }
+        self._save(empty_doc)
+        return True
 
     def _load(self) -> dict:
-        """Read and validate the JSON memory file."""
+        """Read and validate the JSON memory file.
+
+        The parsed document is cached and reused while the file's
+        (inode, mtime_ns, size) stamp is unchanged. ``_save`` always swaps in
+        a new inode via ``os.replace()``, so a write by any process -- this
+        one, a hook, another server -- invalidates the cache on the next call.
+        """
+        stamp = _file_stamp(self._path.stat())
+        if self._cached_doc is not None and stamp == self._cached_stamp:
+            return self._cached_doc
         text = self._path.read_text(encoding="utf-8")
         data = json.loads(text)
         if "schema_version" not in data:
@@ -116,11 +165,27 @@ class MemoryStore:
         if "memories" not in data:
             msg = f"Missing 'memories' in {self._path}"
             raise ValueError(msg)
+        _intern_tags(data["memories"])
+        self._cached_doc = data
+        self._cached_stamp = stamp
         return data
 
     def _save(self, data: dict) -> None:
         """Atomic write: temp file in same directory, then os.replace()."""
-        content = json.dumps(data, indent=JSON_INDENT, ensure_ascii=False) + "\n"
+        if self._in_batch:
+            # Deferred to the end of ``batched()``. The file lock is held
+            # throughout, so the cached stamp stays valid and ``_load`` keeps
+            # returning this document to the operations that follow.
+            self._cached_doc = data
+            self._batch_dirty = True
+            return
+        content = _DOCUMENT_ENCODER.encode(data) + "\n"
+        # Mutations that change nothing (e.g. a duplicate add_link) would
+        # rewrite identical bytes. Skip the write when the file is still the
+        # one this store last wrote and the new text matches it.
+        if self._written is not None and self._written == (self._cached_stamp, content):
+            self._cached_doc = data
+            return
         fd, tmp_path = tempfile.mkstemp(
             dir=self._path.parent,
             prefix=".memory_tmp_",
@@ -128,38 +193,69 @@ class MemoryStore:
         )
         try:
             os.write(fd, content.encode("utf-8"))
+            # Stamp the temp file before the rename: os.replace() keeps its
+            # inode and mtime, and no other writer can have touched it yet.
+            stamp = _file_stamp(os.fstat(fd))
             os.close(fd)
             os.replace(tmp_path, self._path)
         except BaseException:
+            self._drop_cache()
             os.close(fd) if not _is_fd_closed(fd) else None
             with contextlib.suppress(OSError):
                 os.unlink(tmp_path)
             raise
+        self._cached_doc = data
+        self._cached_stamp = stamp
+        self._written = (stamp, content)
+
+    def _drop_cache(self) -> None:
+        self._cached_doc = None
+        self._cached_stamp = None
+
+    @contextlib.contextmanager
+    def _cache_guard(self):
+        """Drop the cached document if a mutation fails part-way through it."""
+        try:
+            yield
+        except BaseException:
+            self._drop_cache()
+            if self._in_batch:
+                self._batch_aborted = True
+            raise
 
     @contextlib.contextmanager
     def _lock(self):
-        """Exclusive file lock for read-modify-write safety."""
-        lock_path = self._path.with_suffix(".lock")
-        lock_path.touch(exist_ok=True)
-        lock_fd = lock_path.open("w")
+        """Exclusive file lock for read-modify-write safety. Re-entrant per thread."""
+        if self._lock_owner == threading.get_ident():
+            yield
+            return
+        # open("w") creates the lock file when missing; no separate touch().
+        lock_fd = self._lock_path.open("w")
         try:
             fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            self._lock_owner = threading.get_ident()
             yield
         finally:
+            self._lock_owner = None
             fcntl.flock(lock_fd, fcntl.LOCK_UN)
             lock_fd.close()
 
     def _auto_migrate_if_needed(self) -> None:
         """Migrate older schema versions to 2.0, or raise on unknown versions."""
-        data = self._load()
-        version = data.get("schema_version")
-
-        if version == SCHEMA_VERSION:
+        if self._load().get("schema_version") == SCHEMA_VERSION:
             return
 
-        if version and version.startswith("1."):
-            self._migrate_v1_to_v2(data)
-            return
+        # Re-check under the lock: a concurrent process (hook, second server)
+        # may have migrated the file already, and migrating twice is wasted I/O.
+        with self._lock():
+            data = self._load()
+            version = data.get("schema_version")
+            if version == SCHEMA_VERSION:
+                return
+            if version and version.startswith("1."):
+                with self._cache_guard():
+                    self._migrate_v1_to_v2(data)
+                return
 
         msg = (
             f"Unsupported schema version '{version}' in {self._path}. Expected '{SCHEMA_VERSION}'."
@@ -175,16 +271,14 @@ class MemoryStore:
         """
         for entries in data.get("memories", {}).values():
             for entry in entries.values():
+                # summary is derived, so only compute it when missing; the
+                # constant defaults go through setdefault (one lookup each).
                 if "summary" not in entry:
                     entry["summary"] = generate_summary(entry.get("value", ""))
-                if "valid_at" not in entry:
-                    entry["valid_at"] = entry.get("created_at")
-                if "invalid_at" not in entry:
-                    entry["invalid_at"] = None
-                if "type" not in entry:
-                    entry["type"] = None
-                if "created_by" not in entry:
-                    entry["created_by"] = None
+                entry.setdefault("valid_at", entry.get("created_at"))
+                entry.setdefault("invalid_at", None)
+                entry.setdefault("type", None)
+                entry.setdefault("created_by", None)
                 source: dict[str, str | None] = entry.get("source", {})
                 if isinstance(source, str):
                     source = {"type": "session", "detail": source}
@@ -204,21 +298,63 @@ class MemoryStore:
     def _read_modify_write(self, mutator):
         """Lock, load, apply mutator, save. Returns mutator's return value."""
         with self._lock():
+            self._check_batch_not_aborted()
             data = self._load()
-            result = mutator(data)
+            with self._cache_guard():
+                result = mutator(data)
             self._save(data)
             return result
 
+    def _check_batch_not_aborted(self) -> None:
+        """Refuse further work in a batch that can no longer be written."""
+        if self._in_batch and self._batch_aborted:
+            msg = "An earlier operation in this batched() block failed; nothing will be written"
+            raise RuntimeError(msg)
+
     # -- Validation helpers ---------------------------------------------------
 
     @staticmethod
     def _validate_category(category: str) -> None:
-        if category not in VALID_CATEGORIES:
+        if category not in VALID_CATEGORY_SET:
             msg = f"Invalid category '{category}'. Must be one of: {', '.join(VALID_CATEGORIES)}"
             raise ValueError(msg)
 
     # -- Public API -----------------------------------------------------------
 
+    @contextlib.contextmanager
+    def batched(self):
+        """Run several operations under one file lock and a single write.
+
+        Mutations inside the block only update the cached document; the file
+        is written once when the block exits. If the block raises, or any
+        operation in it fails, nothing from the block is written. A failed
+        operation may have left the document half-changed, so it poisons the
+        batch even when its exception is caught: later operations in the block
+        raise RuntimeError, and so does the block's exit. Callers therefore
+        never see a successful result that is not saved. A nested
+        ``batched()`` joins the enclosing batch.
+        """
+        if self._in_batch and self._lock_owner == threading.get_ident():
+            yield self
+            return
+        with self._lock():
+            self._in_batch = True
+            self._batch_dirty = False
+            self._batch_aborted = False
+            try:
+                yield self
+                self._check_batch_not_aborted()
+            except BaseException:
+                self._batch_aborted = True
+                raise
+            finally:
+                self._in_batch = False
+                data = self._cached_doc
+                if self._batch_aborted:
+                    self._drop_cache()
+                elif self._batch_dirty and data is not None:
+                    self._save(data)
+
     def session_start(self) -> dict:
         """Increment session_count and return full memory summary."""
 
@@ -268,130 +404,41 @@ class MemoryStore:
         importance = _clamp_importance(importance)
         resolved_tags = sorted(tags) if tags else []
 
-        if not force:
-            candidates = self._find_candidates(category, key, value, resolved_tags, broad=broad)
-            if candidates:
-                recommendation = _recommend_action(candidates, value)
-                if recommendation != "ADD":
-                    return {
-                        "action": "candidates",
-                        "candidates": candidates,
-                        "recommendation": recommendation,
-                    }
-                # ADD recommendation: proceed to write — no second call needed
-
-        return self._do_remember(
-            category,
-            key,
-            value,
-            tags=resolved_tags,
-            importance=importance,
-            source_type=source_type,
-            confidence=confidence,
-            summary=summary,
-            entry_type=entry_type,
-            created_by=created_by,
-        )
-
-    def _find_candidates(
-        self,
-        category: str,
-        key: str,
-        value: str,
-        tags: list[str],
-        *,
-        broad: bool = False,
-    ) -> list[dict]:
-        """Scan for dedup candidates (read-only, no file mutation)."""
-        data = self._load()
-        memories = data.get("memories", {})
-
-        # Check if exact key exists -- skip dedup entirely
-        cat_entries = memories.get(category, {})
-        if key in cat_entries:
-            return []
-
-        all_candidates: list[dict] = []
-        if broad:
-            for cat_name in VALID_CATEGORIES:
-                entries = memories.get(cat_name, {})
-                all_candidates.extend(_find_dedup_candidates(key, value, tags, entries, cat_name))
-        else:
-            all_candidates = _find_dedup_candidates(key, value, tags, cat_entries, category)
-
-        return all_candidates
-
-    def _do_remember(
-        self,
-        category: str,
-        key: str,
-        value: str,
-        *,
-        tags: list[str],
-        importance: int,
-        source_type: str,
-        confidence: float | None,
-        summary: str | None = None,
-        entry_type: str | None = None,
-        created_by: str | None = None,
-    ) -> dict:
-        """Unconditionally create or update a memory entry (no dedup check).
-
-        For new entries (ADD), scans the same category for tag-matched entries
-        and auto-creates ``related-to`` links when 2+ tags overlap.
-        """
-        now = _now_utc()
-        resolved_summary = summary if summary is not None else generate_summary(value)
-
-        def _mutate(data: dict) -> dict:
-            memories = data.setdefault("memories", {})
-            cat_entries = memories.setdefault(category, {})
-
-            if key in cat_entries:
-                existing = cat_entries[key]
-                existing["value"] = value
-                existing["updated_at"] = now
-                existing["summary"] = resolved_summary
-                if tags:
-                    merged = list(set(existing.get("tags", [])) | set(tags))
-                    existing["tags"] = sorted(merged)
-                existing["importance"] = importance
-                if confidence is not None:
-                    existing["confidence"] = confidence
-                if entry_type is not None:
-                    existing["type"] = entry_type
-                if created_by is not None:
-                    existing["created_by"] = created_by
-                return {"action": "UPDATE", "entry": dict(existing)}
-
-            entry = MemoryEntry(
-                value=value,
-                created_at=now,
-                updated_at=now,
-                tags=list(tags),
-                confidence=confidence,
-                importance=importance,
-                source=Source(type=source_type),
-                access_count=0,
-                last_accessed=None,
-                status="active",
-                summary=resolved_summary,
-                valid_at=now,
-                invalid_at=None,
-                type=entry_type,
-                created_by=created_by,
-            )
-            entry_dict = entry.to_dict()
-            cat_entries[key] = entry_dict
-
-            # Auto-link: find tag-matched entries in the same category
-            auto_links = _find_auto_links(category, key, tags, cat_entries)
-            if auto_links:
-                entry_dict["links"] = auto_links
-
-            return {"action": "ADD", "entry": dict(entry_dict)}
-
-        return self._read_modify_write(_mutate)
+        # Dedup scan and write share one locked load: the document is parsed
+        # once per call and no writer can slip in between check and write.
+        with self._lock():
+            self._check_batch_not_aborted()
+            data = self._load()
+            if not force:
+                candidates = _find_candidates(
+                    data.get("memories", {}), category, key, value, resolved_tags, broad=broad
+                )
+                if candidates:
+                    recommendation = _recommend_action(candidates, value)
+                    if recommendation != "ADD":
+                        return {
+                            "action": "candidates",
+                            "candidates": candidates,
+                            "recommendation": recommendation,
+                        }
+                    # ADD recommendation: proceed to write — no second call needed
+
+            with self._cache_guard():
+                result = _apply_remember(
+                    data,
+                    category,
+                    key,
+                    value,
+                    tags=resolved_tags,
+                    importance=importance,
+                    source_type=source_type,
+                    confidence=confidence,
+                    summary=summary,
+                    entry_type=entry_type,
+                    created_by=created_by,
+                )
+            self._save(data)
+            return result
 
     def forget(self, category: str, key: str) -> dict:
         """Soft-delete a memory entry by setting invalid_at and status.
@@ -411,9 +458,8 @@ class MemoryStore:
                 raise KeyError(msg)
 
             # Create backup before mutation
-            backup_path = self._path.with_name(self._path.stem + PRE_FORGET_BACKUP_SUFFIX)
-            backup_content = json.dumps(data, indent=JSON_INDENT, ensure_ascii=False) + "\n"
-            backup_path.write_text(backup_content, encoding="utf-8")
+            backup_path = self._forget_backup_path
+            _write_backup(backup_path, data)
 
             entry = cat_entries[key]
             entry["invalid_at"] = now
@@ -421,7 +467,7 @@ class MemoryStore:
 
             return {
                 "action": "soft_deleted",
-                "entry": dict(entry),
+                "entry": _copy_entry(entry),
                 "backup_path": str(backup_path),
             }
 
@@ -448,9 +494,8 @@ class MemoryStore:
             # Clean up incoming links from all entries pointing to the deleted entry
             _remove_incoming_links(memories, target_ref)
 
-            backup_path = self._path.with_name(self._path.stem + BACKUP_SUFFIX)
-            backup_content = json.dumps(data, indent=JSON_INDENT, ensure_ascii=False) + "\n"
-            backup_path.write_text(backup_content, encoding="utf-8")
+            backup_path = self._delete_backup_path
+            _write_backup(backup_path, data)
 
             return {"removed": removed, "backup_path": str(backup_path)}
 
@@ -472,12 +517,12 @@ class MemoryStore:
                 entry = cat_entries[key]
                 entry["access_count"] = entry.get("access_count", 0) + 1
                 entry["last_accessed"] = now
-                return {"entries": {key: dict(entry)}}
+                return {"entries": {key: _copy_entry(entry)}}
 
             for entry in cat_entries.values():
                 entry["access_count"] = entry.get("access_count", 0) + 1
                 entry["last_accessed"] = now
-            return {"entries": {k: dict(v) for k, v in cat_entries.items()}}
+            return {"entries": {k: _copy_entry(v) for k, v in cat_entries.items()}}
 
         return self._read_modify_write(_mutate)
 
@@ -490,6 +535,7 @@ class MemoryStore:
         include_historical: bool = False,
         since: str | None = None,
         entry_type: str | None = None,
+        limit: int | None = None,
     ) -> dict:
         """Multi-signal ranked search across keys, values, tags, and summaries.
 
@@ -508,9 +554,14 @@ class MemoryStore:
                 ``created_at >= since`` are included.
             entry_type: Optional type filter. Only entries whose ``type`` field
                 matches are included.
+            limit: Optional maximum number of results. Only the returned
+                entries have their access tracking updated.
         """
         if category is not None:
             self._validate_category(category)
+        if limit is not None and limit < 1:
+            msg = f"Invalid limit {limit}. Must be a positive integer"
+            raise ValueError(msg)
         now_str = _now_utc()
         now_dt = datetime.now(UTC)
         query_lower = query.lower()
@@ -520,7 +571,7 @@ class MemoryStore:
             memories = data.get("memories", {})
             categories_to_search = {category: memories.get(category, {})} if category else memories
 
-            results = []
+            scored = []
             for cat_name, entries in categories_to_search.items():
                 for entry_key, entry in entries.items():
                     # Filter inactive entries unless include_historical
@@ -535,48 +586,53 @@ class MemoryStore:
                     if entry_type is not None and entry.get("type") != entry_type:
                         continue
 
-                    match_reasons = _find_match_reasons_multi(
-                        entry_key,
-                        entry,
-                        query_lower,
-                        query_terms,
-                    )
+                    text = _entry_text(entry_key, entry)
+                    match_reasons = _find_match_reasons_multi(text, query_lower, query_terms)
                     if not match_reasons:
                         continue
 
                     # Compute signals BEFORE updating access tracking
                     # so recency reflects the entry's pre-search state
                     signals = {
-                        "text_match": _compute_text_match_score(
-                            entry_key,
-                            entry,
-                            query_lower,
-                        ),
-                        "tag_match": _compute_tag_match_score(
-                            entry,
-                            query_terms,
-                        ),
+                        "text_match": _compute_text_match_score(text, query_lower),
+                        "tag_match": _compute_tag_match_score(text, query_terms),
                         "importance": _compute_importance_score(entry),
                         "recency": _compute_recency_score(entry, now_dt),
                     }
-                    score = _compute_search_score(signals)
+                    score = round(_compute_search_score(signals), 4)
+                    scored.append((score, cat_name, entry_key, entry, signals, match_reasons))
+
+            # Both orderings are stable, so ties keep store order either way;
+            # nlargest avoids sorting the whole match list for a small limit.
+            if limit is not None and limit < len(scored):
+                scored = heapq.nlargest(limit, scored, key=itemgetter(0))
+            else:
+                scored.sort(key=itemgetter(0), reverse=True)
 
-                    # Track access after scoring
-                    entry["access_count"] = entry.get("access_count", 0) + 1
-                    entry["last_accessed"] = now_str
+            results = []
+            for score, cat_name, entry_key, entry, signals, match_reasons in scored:
+                # Track access after scoring, for returned entries only
+                entry["access_count"] = entry.get("access_count", 0) + 1
+                entry["last_accessed"] = now_str
 
+                if detail == "index":
+                    # Only rendered to Markdown below, never returned: the
+                    # entry can be referenced instead of copied.
                     results.append(
-                        {
-                            "category": cat_name,
-                            "key": entry_key,
-                            "entry": dict(entry),
-                            "score": round(score, 4),
-                            "signals": {k: round(v, 4) for k, v in signals.items()},
-                            "match_reason": ", ".join(match_reasons),
-                        }
+                        {"category": cat_name, "key": entry_key, "entry": entry, "score": score}
                     )
-
-            results.sort(key=lambda r: r["score"], reverse=True)
+                    continue
+
+                results.append(
+                    {
+                        "category": cat_name,
+                        "key": entry_key,
+                        "entry": _copy_entry(entry),
+                        "score": score,
+                        "signals": {k: round(v, 4) for k, v in signals.items()},
+                        "match_reason": ", ".join(match_reasons),
+                    }
+                )
 
             if detail == "index":
                 markdown = format_search_results_markdown(results, query)
@@ -611,7 +667,7 @@ class MemoryStore:
         """Export all memories as markdown or JSON."""
         data = self._load()
         if output_format == "json":
-            return {"content": json.dumps(data, indent=JSON_INDENT, ensure_ascii=False)}
+            return {"content": _DOCUMENT_ENCODER.encode(data)}
 
         return {"content": _format_as_markdown(data)}
 
@@ -670,8 +726,7 @@ class MemoryStore:
             now_stamp = _now_utc().replace(":", "-")
             backup_name = f"{self._path.stem}.pre-consolidation-{now_stamp}.json"
             backup_path = self._path.with_name(backup_name)
-            backup_content = json.dumps(data, indent=JSON_INDENT, ensure_ascii=False) + "\n"
-            backup_path.write_text(backup_content, encoding="utf-8")
+            _write_backup(backup_path, data)
 
             mems = data.get("memories", {})
             result = apply_actions(actions, mems)
@@ -754,7 +809,7 @@ class MemoryStore:
         """Create a unidirectional link from source entry to target entry."""
         self._validate_category(source_category)
         self._validate_category(target_category)
-        if relation not in VALID_RELATIONS:
+        if relation not in VALID_RELATION_SET:
             msg = f"Invalid relation '{relation}'. Must be one of: {', '.join(VALID_RELATIONS)}"
             raise ValueError(msg)
 
@@ -875,6 +930,101 @@ class MemoryStore:
 # -- Module-level helpers (kept out of class for readability) -----------------
 
 
+def _find_candidates(
+    memories: dict,
+    category: str,
+    key: str,
+    value: str,
+    tags: list[str],
+    *,
+    broad: bool = False,
+) -> list[dict]:
+    """Scan for dedup candidates (read-only, no mutation)."""
+    # Check if exact key exists -- skip dedup entirely
+    cat_entries = memories.get(category, {})
+    if key in cat_entries:
+        return []
+
+    all_candidates: list[dict] = []
+    if broad:
+        for cat_name in VALID_CATEGORIES:
+            entries = memories.get(cat_name, {})
+            all_candidates.extend(_find_dedup_candidates(key, value, tags, entries, cat_name))
+    else:
+        all_candidates = _find_dedup_candidates(key, value, tags, cat_entries, category)
+
+    return all_candidates
+
+
+def _apply_remember(
+    data: dict,
+    category: str,
+    key: str,
+    value: str,
+    *,
+    tags: list[str],
+    importance: int,
+    source_type: str,
+    confidence: float | None,
+    summary: str | None = None,
+    entry_type: str | None = None,
+    created_by: str | None = None,
+) -> dict:
+    """Unconditionally create or update a memory entry in *data* (no dedup check).
+
+    For new entries (ADD), scans the same category for tag-matched entries
+    and auto-creates ``related-to`` links when 2+ tags overlap.
+    """
+    now = _now_utc()
+    resolved_summary = summary if summary is not None else generate_summary(value)
+    memories = data.setdefault("memories", {})
+    cat_entries = memories.setdefault(category, {})
+
+    if key in cat_entries:
+        existing = cat_entries[key]
+        existing["value"] = value
+        existing["updated_at"] = now
+        existing["summary"] = resolved_summary
+        if tags:
+            merged = list(set(existing.get("tags", [])) | set(tags))
+            existing["tags"] = sorted(merged)
+        existing["importance"] = importance
+        if confidence is not None:
+            existing["confidence"] = confidence
+        if entry_type is not None:
+            existing["type"] = entry_type
+        if created_by is not None:
+            existing["created_by"] = created_by
+        return {"action": "UPDATE", "entry": _copy_entry(existing)}
+
+    entry = MemoryEntry(
+        value=value,
+        created_at=now,
+        updated_at=now,
+        tags=list(tags),
+        confidence=confidence,
+        importance=importance,
+        source=_intern_source(source_type),
+        access_count=0,
+        last_accessed=None,
+        status="active",
+        summary=resolved_summary,
+        valid_at=now,
+        invalid_at=None,
+        type=entry_type,
+        created_by=created_by,
+    )
+    entry_dict = entry.to_dict()
+    cat_entries[key] = entry_dict
+
+    # Auto-link: find tag-matched entries in the same category
+    auto_links = _find_auto_links(category, key, tags, cat_entries)
+    if auto_links:
+        entry_dict["links"] = auto_links
+
+    return {"action": "ADD", "entry": _copy_entry(entry_dict)}
+
+
 def _find_auto_links(
     category: str,
     new_key: str,
@@ -912,11 +1062,15 @@ def _find_auto_links(
 
 
 def _remove_incoming_links(memories: dict, target_ref: str) -> None:
-    """Remove all links pointing to target_ref from all entries in the store."""
-    for _cat_name, entries in memories.items():
-        for _key, entry in entries.items():
-            links = entry.get("links", [])
-            if links:
+    """Remove all links pointing to target_ref from all entries in the store.
+
+    Link lists that do not reference target_ref are left as-is rather than
+    rebuilt, so a hard delete only allocates for the entries it touches.
+    """
+    for entries in memories.values():
+        for entry in entries.values():
+            links = entry.get("links")
+            if links and any(lk["target"] == target_ref for lk in links):
                 entry["links"] = [lk for lk in links if lk["target"] != target_ref]
 
 
@@ -938,6 +1092,45 @@ def _find_incoming_links(memories: dict, target_ref: str) -> list[dict]:
     return incoming
 
 
+def _file_stamp(st: os.stat_result) -> tuple[int, int, int]:
+    """Identity of one version of the memory file, for cache validation."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _intern_tags(memories: dict) -> None:
+    """Share one string object per distinct tag across a parsed document.
+
+    json.loads memoizes object keys but not string values, so a tag used by
+    many entries would otherwise be held once per entry in the cached document.
+    """
+    for entries in memories.values():
+        for entry in entries.values():
+            if tags := entry.get("tags"):
+                entry["tags"] = [sys.intern(t) if isinstance(t, str) else t for t in tags]
+
+
+def _copy_entry(entry: dict) -> dict:
+    """Copy an entry for return to callers, including its nested containers.
+
+    Results must not alias the cached document: a caller mutating a returned
+    ``tags`` list would otherwise silently change what the store holds.
+    """
+    copied = dict(entry)
+    if isinstance(tags := entry.get("tags"), list):
+        copied["tags"] = list(tags)
+    if isinstance(source := entry.get("source"), dict):
+        copied["source"] = dict(source)
+    if isinstance(links := entry.get("links"), list):
+        copied["links"] = [dict(link) for link in links]
+    return copied
+
+
+def _write_backup(backup_path: Path, data: dict) -> None:
+    """Write a compact JSON snapshot of *data* to *backup_path*."""
+    content = _BACKUP_ENCODER.encode(data) + "\n"
+    backup_path.write_text(content, encoding="utf-8")
+
+
 def _is_fd_closed(fd: int) -> bool:
     """Check if a file descriptor is already closed."""
     try:
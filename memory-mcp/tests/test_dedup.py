@@ -81,6 +81,21 @@ class TestDedupTagOverlap:
         assert result["action"] == "candidates"
         assert result["recommendation"] == "UPDATE"
 
+    def test_mutating_candidate_tags_does_not_change_store(self, store: MemoryStore):
+        tags = ["python", "packaging", "hatchling", "build"]
+        store.remember("learnings", "python-packaging", "Use hatchling for builds", tags=tags)
+        result = store.remember(
+            "learnings",
+            "hatch-build-system",
+            "Hatchling is the recommended build backend",
+            tags=["python", "packaging", "hatchling"],
+        )
+        result["candidates"][0]["tags"].append("leaked")
+        store.session_start()  # forces a write of the cached document
+
+        stored = store.recall("learnings", "python-packaging")["entries"]["python-packaging"]
+        assert "leaked" not in stored["tags"]
+
     def test_moderate_overlap_writes_directly(self, store: MemoryStore):
         """Two-tag overlap (below strong threshold) writes immediately."""
         store.remember(
@@ -136,6 +151,13 @@ class TestDedupValueOverlap:
         assert result["action"] == "candidates"
         assert result["recommendation"] == "NOOP"
 
+    def test_candidates_response_leaves_file_untouched(self, store: MemoryStore, memory_file: Path):
+        store.remember("project", "language", "The project uses Python for backend")
+        before = memory_file.read_bytes()
+        result = store.remember("project", "main-language", "The project uses Python for backend")
+        assert result["action"] == "candidates"
+        assert memory_file.read_bytes() == before
+
 
 # -- Exact key match: UPDATE (no dedup) ---------------------------------------
 
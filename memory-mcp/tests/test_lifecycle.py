@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import copy
+import json
 from datetime import UTC, datetime, timedelta
 
 from memory_mcp.lifecycle import (
@@ -54,15 +54,9 @@ def _make_entry(
 def _wrap_data(entries_by_category: dict[str, dict[str, dict]]) -> dict:
     """Wrap category entries into a full memory document."""
     memories = {
-        "user": {},
-        "assistant": {},
-        "project": {},
-        "relationships": {},
-        "tools": {},
-        "learnings": {},
+        cat: entries_by_category.get(cat, {})
+        for cat in ("user", "assistant", "project", "relationships", "tools", "learnings")
     }
-    for cat, entries in entries_by_category.items():
-        memories[cat] = entries
     return {
         "schema_version": "1.1",
         "session_count": 10,
@@ -363,7 +357,8 @@ class TestNoMutation:
                 },
             }
         )
-        original = copy.deepcopy(data)
+        # Entries are plain JSON, so a dumps/loads round-trip is a full snapshot.
+        original = json.loads(json.dumps(data))
         analyze(data, session_count=10)
         assert data == original
 
@@ -55,10 +55,9 @@ def _make_entry(
 def _write_store(memory_file: Path, entries_by_category: dict) -> None:
     """Write a pre-built memory store to the file."""
     memories = {
-        cat: {} for cat in ("user", "assistant", "project", "relationships", "tools", "learnings")
+        cat: entries_by_category.get(cat, {})
+        for cat in ("user", "assistant", "project", "relationships", "tools", "learnings")
     }
-    for cat, entries in entries_by_category.items():
-        memories[cat] = entries
     doc = {
         "schema_version": SCHEMA_VERSION,
         "session_count": 1,
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError, fields
+
 import pytest
 
 from memory_mcp.schema import (
     DEFAULT_IMPORTANCE,
     SCHEMA_VERSION,
     VALID_CATEGORIES,
+    VALID_CATEGORY_SET,
+    VALID_RELATION_SET,
     VALID_RELATIONS,
     VALID_SOURCE_TYPES,
     VALID_STATUSES,
@@ -46,6 +50,17 @@ class TestSource:
         assert source.type == "session"
         assert source.detail is None
 
+    def test_equal_sources_are_interned(self):
+        data = {"type": "inferred", "detail": "pattern match", "agent_id": "a-1"}
+        assert Source.from_dict(data) is Source.from_dict(dict(data))
+
+    def test_missing_source_shares_default_instance(self):
+        data = {"value": "v", "created_at": "t", "updated_at": "t"}
+        first = MemoryEntry.from_dict(data)
+        second = MemoryEntry.from_dict(data)
+        assert first.source is second.source
+        assert first.source == Source()
+
 
 # -- MemoryEntry round-trip ----------------------------------------------------
 
@@ -133,6 +148,19 @@ class TestMemoryEntry:
         result = entry.to_dict()
         assert result == original
 
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Source(),
+            Link(target="user.name", relation="related-to"),
+            MemoryEntry(value="v", created_at="t", updated_at="t"),
+        ],
+        ids=["source", "link", "entry"],
+    )
+    def test_to_dict_covers_every_field(self, instance):
+        """Hand-written serializers must track the dataclass field list."""
+        assert set(instance.to_dict()) == {f.name for f in fields(instance)}
+
     def test_tags_list_is_independent_copy(self):
         """Verify to_dict produces an independent tags list."""
         entry = MemoryEntry(
@@ -201,6 +229,10 @@ class TestConstants:
             "depends-on",
         }
 
+    def test_membership_sets_match_tuples(self):
+        assert frozenset(VALID_CATEGORIES) == VALID_CATEGORY_SET
+        assert frozenset(VALID_RELATIONS) == VALID_RELATION_SET
+
 
 # -- Link round-trip ----------------------------------------------------------
 
@@ -221,7 +253,7 @@ class TestLink:
 
     def test_link_is_frozen(self):
         link = Link(target="user.name", relation="related-to")
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             link.target = "other.key"  # type: ignore[misc]
 
 
@@ -336,9 +368,14 @@ class TestSourceV2:
 
     def test_source_is_frozen(self):
         source = Source(agent_type="implementer")
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             source.agent_type = "other"  # type: ignore[misc]
 
+    def test_models_use_slots(self):
+        entry = MemoryEntry(value="v", created_at="t", updated_at="t")
+        for obj in (entry, entry.source, Link(target="user.name", relation="related-to")):
+            assert not hasattr(obj, "__dict__")
+
 
 # -- v2.0 MemoryEntry with type and created_by --------------------------------
 
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from memory_mcp.schema import MAX_IMPORTANCE, SCHEMA_VERSION
-from memory_mcp.search import RECENCY_DECAY_DAYS, SEARCH_WEIGHTS
+from memory_mcp.search import RECENCY_DECAY_DAYS, SEARCH_WEIGHTS, _compute_recency_score
 from memory_mcp.store import MemoryStore
 
 # -- Fixtures -----------------------------------------------------------------
@@ -57,10 +57,9 @@ def _make_entry(
 def _write_store(memory_file: Path, entries_by_category: dict) -> None:
     """Write a pre-built memory store to the file for direct manipulation."""
     memories = {
-        cat: {} for cat in ("user", "assistant", "project", "relationships", "tools", "learnings")
+        cat: entries_by_category.get(cat, {})
+        for cat in ("user", "assistant", "project", "relationships", "tools", "learnings")
     }
-    for cat, entries in entries_by_category.items():
-        memories[cat] = entries
     doc = {
         "schema_version": SCHEMA_VERSION,
         "session_count": 5,
@@ -242,6 +241,15 @@ class TestRecencyScoreFunction:
         signals_by_key = {r["key"]: r["signals"]["recency"] for r in result["results"]}
         assert signals_by_key["recent"] > signals_by_key["old"]
 
+    def test_recency_decays_by_e_per_decay_period(self):
+        now = datetime(2026, 3, 31, tzinfo=UTC)
+        accessed = (now - timedelta(days=RECENCY_DECAY_DAYS)).isoformat().replace("+00:00", "Z")
+        score = _compute_recency_score({"last_accessed": accessed}, now)
+        assert score == pytest.approx(math.exp(-1))
+
+    def test_never_accessed_has_zero_recency(self):
+        assert _compute_recency_score({"last_accessed": None}, datetime.now(UTC)) == 0.0
+
 
 # -- Ranking by tag match -----------------------------------------------------
 
@@ -331,6 +339,22 @@ class TestTextMatchScoring:
         signals = {r["key"]: r["signals"]["text_match"] for r in result["results"]}
         assert signals["python_tools"] > signals["editor"]
 
+    def test_mixed_case_fields_match_lowercase_query(self, memory_file: Path):
+        _write_store(
+            memory_file,
+            {
+                "user": {
+                    "Python": _make_entry("Main language", tags=["Backend"], importance=5),
+                },
+            },
+        )
+        store = MemoryStore(memory_file)
+        result = store.search("PYTHON backend")
+        [hit] = result["results"]
+        assert hit["signals"]["text_match"] == 0.0
+        assert hit["signals"]["tag_match"] == 0.5
+        assert hit["match_reason"] == "key, tag"
+
 
 # -- Non-matching entries NOT returned ----------------------------------------
 
@@ -439,6 +463,34 @@ class TestCombinedRanking:
         scores = [r["score"] for r in result["results"]]
         assert scores == sorted(scores, reverse=True)
 
+    def test_limit_returns_top_ranked_prefix(self, memory_file: Path):
+        _write_store(
+            memory_file,
+            {
+                "user": {
+                    f"entry_{i}": _make_entry(f"python topic {i}", importance=i)
+                    for i in (3, 1, 5, 2, 4)
+                },
+            },
+        )
+        full = MemoryStore(memory_file).search("python")["results"]
+        limited = MemoryStore(memory_file).search("python", limit=2)["results"]
+        assert [r["key"] for r in limited] == [r["key"] for r in full[:2]]
+        assert [r["key"] for r in limited] == ["entry_5", "entry_4"]
+
+    def test_limit_only_tracks_returned_entries(self, store: MemoryStore):
+        store.remember("user", "name", "python dev", importance=9)
+        store.remember("tools", "lang", "python", importance=1)
+        store.search("python", limit=1)
+        data = json.loads(store._path.read_text())
+        assert data["memories"]["user"]["name"]["access_count"] == 1
+        assert data["memories"]["tools"]["lang"]["access_count"] == 0
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_rejected(self, store: MemoryStore, limit: int):
+        with pytest.raises(ValueError, match="Invalid limit"):
+            store.search("python", limit=limit)
+
 
 # -- Scoring function unit tests (via store integration) ----------------------
 
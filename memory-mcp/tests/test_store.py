@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
-from memory_mcp.schema import SCHEMA_VERSION, VALID_CATEGORIES
+from memory_mcp.schema import SCHEMA_VERSION, TIMESTAMP_FORMAT, VALID_CATEGORIES
 from memory_mcp.store import MemoryStore
 
 # -- Fixtures -----------------------------------------------------------------
@@ -41,7 +43,7 @@ class TestStoreInit:
 
     def test_new_file_has_valid_structure(self, memory_file: Path):
         MemoryStore(memory_file)
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["schema_version"] == SCHEMA_VERSION
         assert data["session_count"] == 0
         assert set(data["memories"].keys()) == set(VALID_CATEGORIES)
@@ -103,7 +105,7 @@ class TestStoreInit:
         }
         memory_file.write_text(json.dumps(old, indent=2) + "\n")
         store = MemoryStore(memory_file)
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["schema_version"] == "2.0"
         assert data["session_count"] == 3
         entry = data["memories"]["learnings"]["test-entry"]
@@ -128,9 +130,37 @@ class TestStoreInit:
         }
         memory_file.write_text(json.dumps(v1_3, indent=2) + "\n")
         MemoryStore(memory_file)
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["schema_version"] == "2.0"
 
+    def test_migration_keeps_fields_already_present(self, memory_file: Path):
+        v1_3 = {
+            "schema_version": "1.3",
+            "session_count": 1,
+            "memories": {
+                "learnings": {
+                    "entry": {
+                        "value": "Test",
+                        "created_at": "2026-01-01T00:00:00Z",
+                        "updated_at": "2026-01-01T00:00:00Z",
+                        "summary": "Custom",
+                        "valid_at": "2026-02-01T00:00:00Z",
+                        "type": "gotcha",
+                        "source": {"type": "inferred", "detail": None, "agent_id": "a-1"},
+                    }
+                }
+            },
+        }
+        memory_file.write_text(json.dumps(v1_3, indent=2) + "\n")
+        MemoryStore(memory_file)
+        entry = json.loads(memory_file.read_bytes())["memories"]["learnings"]["entry"]
+        assert entry["summary"] == "Custom"
+        assert entry["valid_at"] == "2026-02-01T00:00:00Z"
+        assert entry["type"] == "gotcha"
+        assert entry["invalid_at"] is None
+        assert entry["source"]["agent_id"] == "a-1"
+        assert entry["source"]["session_id"] is None
+
     def test_rejects_unknown_schema_version(self, memory_file: Path):
         unknown = {
             "schema_version": "3.0",
@@ -164,7 +194,7 @@ class TestStoreInit:
         }
         memory_file.write_text(json.dumps(old, indent=2) + "\n")
         MemoryStore(memory_file)
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         source = data["memories"]["learnings"]["entry"]["source"]
         assert isinstance(source, dict)
         assert source["type"] == "session"
@@ -181,6 +211,13 @@ class TestCRUDCycle:
         assert result["entry"]["value"] == "Alice"
         assert "identity" in result["entry"]["tags"]
 
+    def test_remember_timestamps_are_fixed_width_utc(self, store: MemoryStore):
+        entry = store.remember("user", "name", "Alice")["entry"]
+        parsed = datetime.strptime(entry["created_at"], TIMESTAMP_FORMAT)
+        assert entry["created_at"] == parsed.strftime(TIMESTAMP_FORMAT)
+        assert len(entry["created_at"]) == len("2026-01-01T00:00:00.000000Z")
+        assert parsed.replace(tzinfo=UTC) <= datetime.now(UTC)
+
     def test_remember_sets_summary_on_create(self, store: MemoryStore):
         result = store.remember("user", "name", "Alice Wonderland")
         assert result["entry"]["summary"] == "Alice Wonderland"
@@ -226,6 +263,12 @@ class TestCRUDCycle:
         assert update_result["entry"]["created_at"] == created_at
         assert update_result["entry"]["updated_at"] != created_at
 
+    def test_remember_entries_do_not_share_source_dict(self, store: MemoryStore):
+        first = store.remember("user", "name", "Alice", force=True)
+        second = store.remember("user", "email", "alice@example.com", force=True)
+        assert first["entry"]["source"] == second["entry"]["source"]
+        assert first["entry"]["source"] is not second["entry"]["source"]
+
     def test_recall_single_entry(self, store: MemoryStore):
         store.remember("user", "name", "Alice")
         result = store.recall("user", "name")
@@ -250,7 +293,7 @@ class TestCRUDCycle:
         assert "backup_path" in result
 
         # Entry still exists in the file -- soft delete, not removal
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert "name" in data["memories"]["user"]
 
     def test_forget_creates_backup_file(self, store: MemoryStore, memory_file: Path):
@@ -258,7 +301,7 @@ class TestCRUDCycle:
         result = store.forget("user", "name")
         backup_path = Path(result["backup_path"])
         assert backup_path.exists()
-        backup_data = json.loads(backup_path.read_text())
+        backup_data = json.loads(backup_path.read_bytes())
         assert "memories" in backup_data
 
     def test_forget_nonexistent_key_raises(self, store: MemoryStore):
@@ -310,7 +353,7 @@ class TestAccessTracking:
         store.remember("user", "name", "Alice")
         store.recall("user", "name")
 
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["memories"]["user"]["name"]["access_count"] == 1
 
 
@@ -373,7 +416,7 @@ class TestSessionStart:
     def test_session_count_persisted(self, store: MemoryStore, memory_file: Path):
         store.session_start()
         store.session_start()
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["session_count"] == 2
 
 
@@ -387,13 +430,12 @@ class TestAtomicWrite:
 
     def test_file_contains_valid_json(self, store: MemoryStore, memory_file: Path):
         store.remember("user", "name", "Alice")
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         assert data["memories"]["user"]["name"]["value"] == "Alice"
 
     def test_file_has_trailing_newline(self, store: MemoryStore, memory_file: Path):
         store.remember("user", "name", "Alice")
-        content = memory_file.read_text()
-        assert content.endswith("\n")
+        assert memory_file.read_bytes().endswith(b"\n")
 
     def test_file_uses_two_space_indent(self, store: MemoryStore, memory_file: Path):
         store.remember("user", "name", "Alice")
@@ -401,6 +443,13 @@ class TestAtomicWrite:
         # Check that the JSON uses 2-space indentation (not 4)
         assert '  "schema_version"' in content
 
+    def test_backup_is_compact_json(self, store: MemoryStore):
+        store.remember("user", "name", "Alice")
+        result = store.forget("user", "name")
+        content = Path(result["backup_path"]).read_text()
+        assert content.count("\n") == 1
+        assert json.loads(content)["memories"]["user"]["name"]["value"] == "Alice"
+
 
 # -- Validation ---------------------------------------------------------------
 
@@ -566,7 +615,7 @@ class TestRememberV2:
 class TestSearchV2:
     def test_search_with_since_filter(self, store: MemoryStore, memory_file: Path):
         # Create entries with specific timestamps via direct file manipulation
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         memories = data["memories"]
         memories["learnings"]["old-tip"] = {
             "value": "python old tip",
@@ -621,7 +670,7 @@ class TestSearchV2:
         assert "tip-b" not in keys
 
     def test_search_with_since_and_type(self, store: MemoryStore, memory_file: Path):
-        data = json.loads(memory_file.read_text())
+        data = json.loads(memory_file.read_bytes())
         memories = data["memories"]
         memories["learnings"]["old-pattern"] = {
             "value": "python old pattern",
@@ -707,3 +756,151 @@ class TestSearchV2:
         entry = result["entries"]["decision-1"]
         assert entry["type"] == "decision"
         assert entry["created_by"] == "architect"
+
+
+# -- Parsed-document cache ----------------------------------------------------
+
+
+class TestDocumentCache:
+    def test_picks_up_writes_from_another_store(self, store: MemoryStore, memory_file: Path):
+        store.recall("user")
+        MemoryStore(memory_file).remember("user", "name", "Written elsewhere", force=True)
+        assert store.recall("user", "name")["entries"]["name"]["value"] == "Written elsewhere"
+
+    def test_picks_up_in_place_rewrite(self, store: MemoryStore, memory_file: Path):
+        store.remember("user", "name", "Before", force=True)
+        data = json.loads(memory_file.read_bytes())
+        data["memories"]["user"]["name"]["value"] = "After, edited by hand"
+        memory_file.write_text(json.dumps(data, indent=2))
+        assert store.status()["total"] == 1
+        assert store.recall("user", "name")["entries"]["name"]["value"] == "After, edited by hand"
+
+    def test_tags_shared_across_entries_are_interned(self, store: MemoryStore, memory_file: Path):
+        store.remember("user", "name", "Alice", tags=["person"], force=True)
+        store.remember("user", "friend", "Bob", tags=["person"], force=True)
+        memory_file.write_text(memory_file.read_text() + "\n")
+        user = store._load()["memories"]["user"]
+        assert user["name"]["tags"][0] is user["friend"]["tags"][0]
+
+    def test_no_op_mutation_skips_write(self, store: MemoryStore, memory_file: Path):
+        store.remember("user", "name", "Alice", force=True)
+        store.remember("project", "db", "Postgres", force=True)
+        store.add_link("user", "name", "project", "db", "related-to")
+        inode = memory_file.stat().st_ino
+        result = store.add_link("user", "name", "project", "db", "related-to")
+        assert result["reason"] == "duplicate"
+        assert memory_file.stat().st_ino == inode
+
+    def test_no_op_mutation_rewrites_externally_changed_file(
+        self, store: MemoryStore, memory_file: Path
+    ):
+        store.remember("user", "name", "Alice", force=True)
+        store.remember("project", "db", "Postgres", force=True)
+        store.add_link("user", "name", "project", "db", "related-to")
+        memory_file.write_text(memory_file.read_text().replace("  ", "    "))
+        store.add_link("user", "name", "project", "db", "related-to")
+        assert '\n  "schema_version"' in memory_file.read_text()
+
+    def test_returned_entries_do_not_alias_store(self, store: MemoryStore):
+        result = store.remember("user", "name", "Alice", tags=["person"], force=True)
+        result["entry"]["tags"].append("mutated")
+        result["entry"]["source"]["type"] = "mutated"
+        recalled = store.recall("user", "name")["entries"]["name"]
+        assert recalled["tags"] == ["person"]
+        assert recalled["source"]["type"] == "session"
+
+    def test_failed_mutation_leaves_no_partial_state(
+        self, store: MemoryStore, monkeypatch: pytest.MonkeyPatch
+    ):
+        store.remember("user", "name", "Alice", force=True)
+
+        def archive_then_fail(actions: list[dict], memories: dict) -> dict:
+            memories["user"]["name"]["status"] = "archived"
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr("memory_mcp.store.apply_actions", archive_then_fail)
+        with pytest.raises(RuntimeError):
+            store.consolidate([{"type": "archive", "category": "user", "key": "name"}])
+        assert store.recall("user", "name")["entries"]["name"]["status"] == "active"
+
+
+# -- Batched writes -----------------------------------------------------------
+
+
+class TestBatched:
+    def test_writes_once_on_exit(self, store: MemoryStore, memory_file: Path):
+        before = memory_file.read_bytes()
+        with store.batched():
+            store.remember("user", "name", "Alice", force=True)
+            store.remember("user", "email", "alice@example.com", force=True)
+            store.session_start()
+            assert memory_file.read_bytes() == before
+        data = json.loads(memory_file.read_bytes())
+        assert set(data["memories"]["user"]) == {"name", "email"}
+        assert data["session_count"] == 1
+
+    def test_operations_see_earlier_batched_changes(self, store: MemoryStore):
+        with store.batched():
+            store.remember("user", "name", "Alice", force=True)
+            assert store.recall("user", "name")["entries"]["name"]["value"] == "Alice"
+
+    def test_exception_discards_batch(self, store: MemoryStore, memory_file: Path):
+        before = memory_file.read_bytes()
+
+        def remember_then_fail() -> None:
+            with store.batched():
+                store.remember("user", "name", "Alice", force=True)
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            remember_then_fail()
+        assert memory_file.read_bytes() == before
+        assert store.recall("user")["entries"] == {}
+
+    def test_caught_failure_still_fails_batch(self, store: MemoryStore, memory_file: Path):
+        before = memory_file.read_bytes()
+
+        def swallow_failure_then_continue() -> None:
+            with store.batched():
+                store.remember("user", "name", "Alice", force=True)
+                with contextlib.suppress(KeyError):
+                    store.forget("user", "missing")
+                store.remember("user", "email", "alice@example.com", force=True)
+
+        with pytest.raises(RuntimeError, match="batched"):
+            swallow_failure_then_continue()
+        assert memory_file.read_bytes() == before
+        assert store.recall("user")["entries"] == {}
+
+    def test_remember_after_caught_failure_raises(self, store: MemoryStore):
+        def remember_after_failure() -> None:
+            with store.batched():
+                with contextlib.suppress(KeyError):
+                    store.forget("user", "missing")
+                with pytest.raises(RuntimeError, match="batched"):
+                    store.remember("user", "name", "Alice", force=True)
+
+        with pytest.raises(RuntimeError, match="batched"):
+            remember_after_failure()
+        assert store.recall("user")["entries"] == {}
+
+    def test_caught_failure_fails_batch_exit(self, store: MemoryStore, memory_file: Path):
+        before = memory_file.read_bytes()
+
+        def swallow_last_failure() -> None:
+            with store.batched():
+                store.remember("user", "name", "Alice", force=True)
+                with contextlib.suppress(KeyError):
+                    store.forget("user", "missing")
+
+        with pytest.raises(RuntimeError, match="batched"):
+            swallow_last_failure()
+        assert memory_file.read_bytes() == before
+
+    def test_nested_batch_joins_outer(self, store: MemoryStore, memory_file: Path):
+        before = memory_file.read_bytes()
+        with store.batched():
+            with store.batched():
+                store.remember("user", "name", "Alice", force=True)
+            assert memory_file.read_bytes() == before
+        assert "name" in json.loads(memory_file.read_bytes())["memories"]["user"]
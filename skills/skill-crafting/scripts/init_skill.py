@@ -9,6 +9,7 @@ Examples:
     python init_skill.py my-api-helper --path ~/.claude/skills
 """
 
+import argparse
 import re
 import sys
 from pathlib import Path
@@ -272,19 +273,29 @@ def init_skill(skill_name: str, output_path: Path) -> int:
     return 0
 
 
-def main() -> int:
-    if len(sys.argv) != 4 or sys.argv[2] != "--path":
-        print("Usage: init_skill.py <skill-name> --path <output-directory>")
-        print()
-        print("Examples:")
-        print("  init_skill.py pdf-processing --path skills/")
-        print("  init_skill.py my-api-helper --path ~/.claude/skills")
-        return 1
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Create a new skill directory from template.",
+        epilog=(
+            "examples:\n"
+            "  init_skill.py pdf-processing --path skills/\n"
+            "  init_skill.py my-api-helper --path ~/.claude/skills"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p.add_argument("skill_name", metavar="skill-name", help="kebab-case skill name")
+    p.add_argument(
+        "--path",
+        type=Path,
+        required=True,
+        help="output directory; the skill is created as <path>/<skill-name>",
+    )
+    return p
 
-    skill_name = sys.argv[1]
-    output_path = Path(sys.argv[3]).resolve()
 
-    return init_skill(skill_name, output_path)
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return init_skill(args.skill_name, args.path.expanduser().resolve())
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Examples:
     python package_skill.py skills/pdf-processing ./dist
 """
 
+import os
 import sys
 import zipfile
 from pathlib import Path
@@ -21,8 +22,50 @@ SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 from validate import validate_skill
 
+ARCHIVE_WRITE_BUFFER = 1 << 20  # 1 MiB
+
+# Already-compressed formats: deflating them again costs time and saves nothing.
+STORED_EXTENSIONS = frozenset(
+    {
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".webp",
+        ".woff2",
+        ".zip",
+    }
+)
+
+
+def _walk_files(root: Path) -> list[str]:
+    """Return paths of all files under root, sorted component-wise like Path.
+
+    Uses an explicit os.scandir stack: directory entries carry their type, so
+    classifying them needs no per-entry stat. Symlinked files are included
+    (their targets get archived); symlinked directories are not descended,
+    matching Path.rglob.
+    """
+    files: list[str] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+    files.sort(key=lambda path: path.split(os.sep))
+    return files
+
 
 def package_skill(skill_path: Path, output_dir: Path | None = None) -> int:
+    # Absolute path, so archive names can be sliced off its parent below and
+    # the skill name is right even for relative inputs such as ".".
+    skill_path = skill_path.resolve()
     if not skill_path.is_dir():
         print(f"Error: not a directory: {skill_path}", file=sys.stderr)
         return 1
@@ -50,12 +93,22 @@ def package_skill(skill_path: Path, output_dir: Path | None = None) -> int:
     skill_file = dest / f"{skill_name}.skill"
 
     # Create .skill archive
-    with zipfile.ZipFile(skill_file, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_path in sorted(skill_path.rglob("*")):
-            if not file_path.is_file():
-                continue
-            arcname = file_path.relative_to(skill_path.parent)
-            zf.write(file_path, arcname)
+    # Archive names are relative to the skill's parent, so they start with
+    # the skill directory name.
+    base = str(skill_path.parent)
+    # A large write buffer lets the deflate output of many small members go
+    # out in a few big writes instead of one per default-sized buffer.
+    with (
+        open(skill_file, "wb", buffering=ARCHIVE_WRITE_BUFFER) as out,
+        zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf,
+    ):
+        for file_path in _walk_files(skill_path):
+            arcname = file_path[len(base) :].lstrip(os.sep)
+            ext = os.path.splitext(file_path)[1].lower()
+            compress_type = (
+                zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+            )
+            zf.write(file_path, arcname, compress_type)
             print(f"  Added: {arcname}")
 
     print(f"\nPackaged: {skill_file}")
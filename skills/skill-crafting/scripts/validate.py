@@ -15,12 +15,29 @@ Validates:
     staleness_sensitive_sections, staleness_threshold_days
   - No unknown top-level fields
 
+Frontmatter is parsed with PyYAML, which is authoritative: it reads YAML the
+way skill loaders do. Without PyYAML a lenient line-based parser is used
+instead and a warning is printed; it accepts some frontmatter that is not
+valid YAML, so a skill passing under it may still fail with PyYAML.
+
 Exit 0 on success, exit 1 on failure.
 """
 
+import os
 import re
 import sys
+from datetime import date
 from pathlib import Path
+from typing import Any
+
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore[assignment]
+    _YamlLoader = None
+else:
+    # LibYAML's C loader when PyYAML was built with it, pure Python otherwise.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 REQUIRED_FIELDS = {"name", "description"}
 OPTIONAL_FIELDS = {
@@ -35,9 +52,14 @@ OPTIONAL_FIELDS = {
 ALL_KNOWN_FIELDS = REQUIRED_FIELDS | OPTIONAL_FIELDS
 
 NAME_PATTERN = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$")
+KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
 NAME_MAX_LENGTH = 64
 DESCRIPTION_MAX_LENGTH = 1024
 COMPATIBILITY_MAX_LENGTH = 500
+# Fields validated as text; YAML may hand back numbers, dates or null for them.
+SCALAR_FIELDS = {"name", "description", "license", "compatibility"}
+# YAML scalar types that read naturally as text once converted with str().
+_TEXT_LIKE_TYPES = (str, int, float, bool, date)
 
 
 def extract_frontmatter(content: str) -> tuple[str | None, list[str]]:
@@ -59,7 +81,40 @@ def extract_frontmatter(content: str) -> tuple[str | None, list[str]]:
     return raw, []
 
 
-def parse_frontmatter(raw: str) -> tuple[dict[str, str], list[str]]:
+def parse_frontmatter(raw: str) -> tuple[dict[str, Any], list[str]]:
+    """Parse frontmatter text into top-level fields.
+
+    Uses PyYAML when it is installed, so quoting, lists, nested maps and
+    comments parse as YAML does. Scalar fields holding a plain YAML scalar
+    are coerced to stripped strings; a list or mapping there is an error.
+    Without PyYAML, falls back to a line-based key-value parser.
+    """
+    if yaml is None:
+        return _parse_frontmatter_lines(raw)
+
+    try:
+        data = yaml.load(raw, Loader=_YamlLoader)
+    except yaml.YAMLError as exc:
+        return {}, [f"Invalid YAML in frontmatter: {exc}"]
+    if not isinstance(data, dict):
+        return {}, ["Frontmatter must be a mapping of fields"]
+
+    fields: dict[str, Any] = {}
+    errors: list[str] = []
+    for key, value in data.items():
+        key = str(key)
+        if key in SCALAR_FIELDS:
+            if value is None:
+                value = ""
+            elif isinstance(value, _TEXT_LIKE_TYPES):
+                value = str(value).strip()
+            else:
+                errors.append(f"'{key}' must be a string")
+        fields[key] = value
+    return fields, errors
+
+
+def _parse_frontmatter_lines(raw: str) -> tuple[dict[str, Any], list[str]]:
     """Parse simple YAML key-value pairs from frontmatter text.
 
     Handles single-line values, YAML folded scalars (>), literal scalars (|),
@@ -75,11 +130,11 @@ def parse_frontmatter(raw: str) -> tuple[dict[str, str], list[str]]:
             fields[current_key] = " ".join(current_value_lines).strip()
 
     for line in raw.split("\n"):
-        key_match = re.match(r"^([a-z][a-z0-9_-]*)\s*:\s*(.*)", line)
-        if key_match:
+        key = _line_key(line)
+        if key is not None:
             flush()
-            current_key = key_match.group(1)
-            value = key_match.group(2).strip()
+            current_key = key
+            value = line[line.index(":") + 1 :].strip()
             # Skip YAML block scalar indicators (> or |)
             if value in (">", "|", ">-", "|-"):
                 current_value_lines = []
@@ -99,6 +154,21 @@ def parse_frontmatter(raw: str) -> tuple[dict[str, str], list[str]]:
     return fields, errors
 
 
+def _line_key(line: str) -> str | None:
+    """Return the key of a ``key: value`` line, or None if the line has none.
+
+    Keys are a lowercase letter followed by lowercase letters, digits,
+    underscores or hyphens; whitespace may sit between key and colon.
+    """
+    colon = line.find(":")
+    if colon <= 0:
+        return None
+    key = line[:colon].rstrip()
+    if not key or not "a" <= key[0] <= "z" or not KEY_CHARS.issuperset(key):
+        return None
+    return key
+
+
 def validate_name(name: str, expected_dir: str) -> list[str]:
     """Validate the name field value."""
     errors: list[str] = []
@@ -133,7 +203,7 @@ def validate_description(desc: str) -> list[str]:
             f"'description' exceeds {DESCRIPTION_MAX_LENGTH} chars (got {len(desc)})"
         )
 
-    if re.search(r"[<>]", desc):
+    if "<" in desc or ">" in desc:
         errors.append("'description' must not contain angle brackets (< or >)")
 
     return errors
@@ -148,15 +218,27 @@ def validate_compatibility(value: str) -> list[str]:
     return []
 
 
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file in one read call sized from fstat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
 def validate_skill(skill_dir: Path) -> list[str]:
     """Run all validations on a skill directory. Returns list of errors."""
     errors: list[str] = []
 
     skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
+    try:
+        data = _read_bytes(skill_md)
+    except FileNotFoundError:
         return [f"SKILL.md not found in {skill_dir}"]
 
-    content = skill_md.read_text(encoding="utf-8")
+    # No frontmatter means nothing else to check, so skip decoding the body.
+    content = data.decode("utf-8") if data.startswith(b"---") else ""
     dir_name = skill_dir.name
 
     # Extract frontmatter
@@ -166,7 +248,9 @@ def validate_skill(skill_dir: Path) -> list[str]:
 
     assert raw is not None
     fields, parse_errors = parse_frontmatter(raw)
-    errors.extend(parse_errors)
+    if parse_errors:
+        # Field checks on a partial or empty parse only add noise.
+        return parse_errors
 
     # Check for unknown fields
     unknown = set(fields.keys()) - ALL_KNOWN_FIELDS
@@ -222,6 +306,15 @@ def _validate_all(repo_root: Path) -> int:
     return 0
 
 
+def _warn_if_fallback_parser() -> None:
+    if yaml is None:
+        print(
+            "Warning: PyYAML is not installed; using the lenient line-based "
+            "frontmatter parser. PyYAML results are authoritative.",
+            file=sys.stderr,
+        )
+
+
 def main() -> int:
     if len(sys.argv) != 2:
         print(
@@ -231,6 +324,7 @@ def main() -> int:
         return 1
 
     arg = sys.argv[1]
+    _warn_if_fallback_parser()
     if arg == "--all":
         return _validate_all(_repo_root_from_script())
 
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import threading
 from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
+from itertools import islice
 from uuid import uuid4
 
 
@@ -72,6 +76,13 @@ class Event:
     tool_use_id: str = ""
 
     def to_dict(self) -> dict:
+        """Serialized form; the caller owns the returned dict."""
+        d = self._serialized
+        return {**d, "labels": dict(d["labels"]), "metadata": dict(d["metadata"])}
+
+    @functools.cached_property
+    def _serialized(self) -> dict:
+        """Built once per event and shared inside EventStore -- never mutated."""
         d = {
             "event_type": self.event_type.value,
             "agent_type": self.agent_type,
@@ -118,6 +129,13 @@ class Interaction:
     labels: dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
+        """Serialized form; the caller owns the returned dict."""
+        d = self._serialized
+        return {**d, "labels": dict(d["labels"])}
+
+    @functools.cached_property
+    def _serialized(self) -> dict:
+        """Built once per interaction and shared inside EventStore -- never mutated."""
         return {
             "source": self.source,
             "target": self.target,
@@ -166,17 +184,45 @@ class AgentState:
 
 
 DEFAULT_MAX_EVENTS = 10_000
+DEFAULT_MAX_INTERACTIONS = 10_000
 DEFAULT_EVENT_LIMIT = 20
+# Per-subscriber backlog; a client that falls further behind loses its oldest events.
+SUBSCRIBER_QUEUE_SIZE = 1024
 
 
 class EventStore:
-    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+    def __init__(
+        self,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_interactions: int = DEFAULT_MAX_INTERACTIONS,
+    ) -> None:
         self._events: deque[Event] = deque(maxlen=max_events)
-        self._interactions: list[Interaction] = []
+        # The same events split by agent_type, kept in step with _events.
+        self._events_by_agent: dict[str, deque[Event]] = {}
+        self._interactions: deque[Interaction] = deque(maxlen=max_interactions)
+        # Chain entries for the delegations in _interactions, in the same order.
+        self._delegation_chain: deque[dict] = deque()
+        # Delegations in _interactions grouped by target, oldest first, for
+        # agents that start later. Pruned with _interactions, so it stays bounded.
+        self._delegations_to: dict[str, deque[Interaction]] = {}
         self._agents: dict[str, AgentState] = {}
         self._lock = threading.Lock()
         self._subscribers: list[asyncio.Queue[Event]] = []
         self._loop: asyncio.AbstractEventLoop | None = None
+        # Summary dict and its encoding, built on demand and dropped whenever
+        # an event or interaction lands. Never handed out as-is.
+        self._summary: dict | None = None
+        self._summary_json: bytes | None = None
+        self._store_id = _uuid()
+        self._revision = 0
+
+    @property
+    def state_version(self) -> str:
+        """Opaque tag that changes whenever an event or interaction is added.
+
+        Unique per store instance, so a restarted server never reuses a tag.
+        """
+        return f"{self._store_id}-{self._revision}"
 
     def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Register the event loop for cross-thread SSE broadcasting."""
@@ -184,15 +230,35 @@ class EventStore:
 
     def add(self, event: Event) -> None:
         with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self._unindex_oldest_event()
             self._events.append(event)
+            self._events_by_agent.setdefault(event.agent_type, deque()).append(event)
             self._update_agent_state(event)
+            self._summary = None
+            self._summary_json = None
+            self._revision += 1
         self._notify(event)
 
     def add_interaction(self, interaction: Interaction) -> str:
         with self._lock:
+            if len(self._interactions) == self._interactions.maxlen:
+                self._unindex_oldest_interaction()
             self._interactions.append(interaction)
             if interaction.interaction_type == "delegation":
+                self._delegation_chain.append(
+                    {
+                        "parent": interaction.source,
+                        "child": interaction.target,
+                        "reason": interaction.summary,
+                        "timestamp": interaction.timestamp.isoformat(),
+                    }
+                )
+                self._delegations_to.setdefault(interaction.target, deque()).append(interaction)
                 self._register_delegation_from_interaction(interaction)
+            self._summary = None
+            self._summary_json = None
+            self._revision += 1
         synthetic = Event(
             event_type=EventType.TOOL_USE,
             agent_type=interaction.source,
@@ -203,6 +269,25 @@ class EventStore:
         self._notify(synthetic)
         return interaction.interaction_id
 
+    def _unindex_oldest_event(self) -> None:
+        """Drop the event about to fall off _events from its agent's index."""
+        oldest = self._events[0]
+        agent_events = self._events_by_agent[oldest.agent_type]
+        agent_events.popleft()
+        if not agent_events:
+            del self._events_by_agent[oldest.agent_type]
+
+    def _unindex_oldest_interaction(self) -> None:
+        """Drop the interaction about to fall off _interactions from the indexes."""
+        oldest = self._interactions[0]
+        if oldest.interaction_type != "delegation":
+            return
+        self._delegation_chain.popleft()
+        pending = self._delegations_to[oldest.target]
+        pending.popleft()
+        if not pending:
+            del self._delegations_to[oldest.target]
+
     def _update_agent_state(self, event: Event) -> None:
         agent_key = event.agent_id or event.agent_type
 
@@ -255,39 +340,73 @@ class EventStore:
                 child.task_summary = interaction.summary
 
     def _apply_pending_delegation(self, state: AgentState) -> None:
-        """Check existing delegation interactions for an agent that just started."""
+        """Check existing delegation interactions for an agent that just started.
+
+        Only the earliest delegation to the agent still in the interaction
+        window applies, so this is a dict lookup rather than a scan of every
+        recorded interaction.
+        """
         agent_key = state.agent_id or state.agent_type
-        for interaction in self._interactions:
-            if interaction.interaction_type != "delegation":
-                continue
-            if interaction.target == agent_key and not state.delegation_parent:
-                state.delegation_parent = interaction.source
-                if not state.task_summary:
-                    state.task_summary = interaction.summary
-                if interaction.source in self._agents:
-                    parent = self._agents[interaction.source]
-                    if agent_key not in parent.delegation_children:
-                        parent.delegation_children.append(agent_key)
+        pending = self._delegations_to.get(agent_key)
+        if not pending or state.delegation_parent:
+            return
+        interaction = pending[0]
+        state.delegation_parent = interaction.source
+        if not state.task_summary:
+            state.task_summary = interaction.summary
+        if interaction.source in self._agents:
+            parent = self._agents[interaction.source]
+            if agent_key not in parent.delegation_children:
+                parent.delegation_children.append(agent_key)
 
     def get_delegation_chain(self) -> list[dict]:
-        return [
-            {
-                "parent": interaction.source,
-                "child": interaction.target,
-                "reason": interaction.summary,
-                "timestamp": interaction.timestamp.isoformat(),
-            }
-            for interaction in self._interactions
-            if interaction.interaction_type == "delegation"
-        ]
+        return [dict(link) for link in self._delegation_chain]
 
     def get_pipeline_summary(self) -> dict:
+        """Snapshot of agents, interactions, and recent events.
+
+        Built once per state change; each call returns a copy of the cached
+        summary down to the per-item dicts and their labels, so the caller
+        may modify it freely without re-serializing anything.
+        """
+        with self._lock:
+            summary = self._cached_summary()
+        return {
+            "agents": {key: _copy_item(agent) for key, agent in summary["agents"].items()},
+            "interactions": [_copy_item(i) for i in summary["interactions"]],
+            "delegation_chain": [dict(link) for link in summary["delegation_chain"]],
+            "event_count": summary["event_count"],
+            "recent_events": [_copy_item(e) for e in summary["recent_events"]],
+        }
+
+    def get_pipeline_summary_json(self) -> tuple[str, bytes]:
+        """The pipeline summary as compact UTF-8 JSON, with its state version.
+
+        Encoded once per state change and cached until the next
+        ``add``/``add_interaction``, so repeated polls of an idle pipeline
+        reuse the same immutable bytes. The version is read under the same
+        lock, so it always describes the returned bytes.
+        """
+        with self._lock:
+            if self._summary_json is None:
+                self._summary_json = json.dumps(
+                    self._cached_summary(), ensure_ascii=False, separators=(",", ":")
+                ).encode()
+            return self.state_version, self._summary_json
+
+    def _cached_summary(self) -> dict:
+        if self._summary is None:
+            self._summary = self._build_pipeline_summary()
+        return self._summary
+
+    def _build_pipeline_summary(self) -> dict:
+        # Shares the cached per-item dicts: callers only ever get copies.
         return {
             "agents": {key: state.to_dict() for key, state in self._agents.items()},
-            "interactions": [i.to_dict() for i in self._interactions],
-            "delegation_chain": self.get_delegation_chain(),
+            "interactions": [i._serialized for i in self._interactions],
+            "delegation_chain": list(self._delegation_chain),
             "event_count": len(self._events),
-            "recent_events": [e.to_dict() for e in list(self._events)[-DEFAULT_EVENT_LIMIT:]],
+            "recent_events": [e._serialized for e in list(self._events)[-DEFAULT_EVENT_LIMIT:]],
         }
 
     def get_events_by_agent(
@@ -296,13 +415,21 @@ class EventStore:
         limit: int = DEFAULT_EVENT_LIMIT,
         label: str | None = None,
     ) -> list[dict]:
-        matching = [e for e in self._events if e.agent_type == agent_type]
-        if label is not None:
-            matching = _filter_by_label(matching, label)
-        return [e.to_dict() for e in matching[-limit:]]
+        """Most recent events for an agent type, oldest first.
+
+        Walks the agent's events from the newest end and stops after *limit*
+        matches, so the cost follows *limit*, not the agent's history length.
+        A non-positive *limit* returns every match.
+        """
+        with self._lock:
+            newest_first: Iterable[Event] = reversed(self._events_by_agent.get(agent_type, ()))
+            if label is not None:
+                newest_first = _filter_by_label(newest_first, label)
+            tail = list(islice(newest_first, limit if limit > 0 else None))
+        return [e.to_dict() for e in reversed(tail)]
 
     def subscribe(self) -> asyncio.Queue[Event]:
-        queue: asyncio.Queue[Event] = asyncio.Queue()
+        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
         self._subscribers.append(queue)
         return queue
 
@@ -313,19 +440,38 @@ class EventStore:
             pass
 
     def _notify(self, event: Event) -> None:
-        """Broadcast event to SSE subscribers, safe from any thread."""
+        """Broadcast event to SSE subscribers, safe from any thread.
+
+        Subscriber queues are bounded and a full one sheds its oldest event,
+        so a stalled client never holds up the store or the other
+        subscribers, and catches up on the newest events when it resumes.
+        """
         if not self._loop or not self._subscribers:
             return
         for queue in list(self._subscribers):
             try:
-                self._loop.call_soon_threadsafe(queue.put_nowait, event)
+                self._loop.call_soon_threadsafe(_put_dropping_oldest, queue, event)
             except RuntimeError:
                 pass  # event loop closed
 
 
-def _filter_by_label(events: list[Event], label: str) -> list[Event]:
-    """Filter events by label expression. Supports 'key=value' or 'key' (exists check)."""
+def _put_dropping_oldest(queue: asyncio.Queue[Event], event: Event) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+def _copy_item(item: dict) -> dict:
+    """Copy a serialized agent/event/interaction and its nested dicts and lists."""
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in item.items()
+    }
+
+
+def _filter_by_label(events: Iterable[Event], label: str) -> Iterator[Event]:
+    """Lazily filter events by label expression. Supports 'key=value' or 'key' (exists check)."""
     if "=" in label:
         key, value = label.split("=", 1)
-        return [e for e in events if e.labels.get(key) == value]
-    return [e for e in events if label in e.labels]
+        return (e for e in events if e.labels.get(key) == value)
+    return (e for e in events if label in e.labels)
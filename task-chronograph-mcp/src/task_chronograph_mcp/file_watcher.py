@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import UTC, datetime
 from pathlib import Path
@@ -80,39 +81,77 @@ def _parse_timestamp(timestamp_str: str) -> datetime:
         return datetime.now(UTC)
 
 
+def _read_new_lines(progress_file: Path, offset: int) -> tuple[list[str], int]:
+    """Read complete lines written after *offset* and return them with the new offset.
+
+    A trailing line without its newline is left for the next read, so a
+    write caught mid-line is not parsed half-finished. A file shorter than
+    *offset* was truncated or replaced and is read again from the start.
+    """
+    with progress_file.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < offset:
+            offset = 0
+        f.seek(offset)
+        data = f.read()
+    complete = data.rfind(b"\n") + 1
+    if not complete:
+        return [], offset
+    text = data[:complete].decode("utf-8", errors="replace")
+    return text.splitlines(), offset + complete
+
+
+def _end_of_last_line(progress_file: Path, chunk_size: int = 4096) -> int:
+    """Return the offset just past the file's last newline (0 if it has none).
+
+    Used as the starting offset, so a line still being written when the
+    watcher starts is read whole once it is finished, not from mid-line.
+    Scans backwards from the end, reading only the unterminated tail.
+    """
+    with progress_file.open("rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        while end > 0:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            end = start
+    return 0
+
+
 async def watch_progress_file(path: Path, store: EventStore) -> None:
     """Watch a directory tree for PROGRESS.md changes and convert new lines to events.
 
     Watches `.ai-work/` and all task-scoped subdirectories (e.g.,
-    `.ai-work/<task-slug>/PROGRESS.md`).  Tracks line counts per file so
-    multiple concurrent pipelines are handled independently.
+    `.ai-work/<task-slug>/PROGRESS.md`).  Tracks a byte offset per file so
+    multiple concurrent pipelines are handled independently and each change
+    reads only the bytes appended since the last one.
 
     The watcher skips lines that existed before it started (no history replay).
     New lines are parsed and, if valid, added to the store as phase-transition events.
     """
-    line_counts: dict[Path, int] = {}
+    offsets: dict[Path, int] = {}
 
-    # Seed counts for any pre-existing PROGRESS.md files (root + subdirs)
+    # Seed offsets for any pre-existing PROGRESS.md files (root + subdirs)
     for progress_file in path.rglob(PROGRESS_FILENAME):
         try:
-            line_counts[progress_file] = len(progress_file.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            line_counts[progress_file] = 0
+            offsets[progress_file] = _end_of_last_line(progress_file)
+        except OSError:
+            offsets[progress_file] = 0
 
     async for changes in awatch(path):
-        for _change_type, changed_path in changes:
-            if Path(changed_path).name != PROGRESS_FILENAME:
-                continue
-            changed = Path(changed_path)
+        # One save often yields several change entries for the same file.
+        changed_files = {
+            Path(changed_path)
+            for _change_type, changed_path in changes
+            if Path(changed_path).name == PROGRESS_FILENAME
+        }
+        for changed in changed_files:
             try:
-                lines = changed.read_text().splitlines()
-            except (OSError, UnicodeDecodeError):
+                new_lines, offsets[changed] = _read_new_lines(changed, offsets.get(changed, 0))
+            except OSError:
                 continue
 
-            last = line_counts.get(changed, 0)
-            new_lines = lines[last:]
-            line_counts[changed] = len(lines)
-
             for line in new_lines:
                 event = parse_progress_line(line)
                 if event is not None:
@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.routing import Mount, Route
 
 from task_chronograph_mcp.events import (
@@ -30,6 +32,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_PORT = 8765
 PORT_RANGE_SIZE = 1000  # ports 8765-9764
 WATCH_DIR_ENV = "CHRONOGRAPH_WATCH_DIR"
+# Request bodies at least this large are parsed in a worker thread.
+THREADED_PARSE_BYTES = 64 * 1024
+
+# Wire value -> member lookups, so invalid input costs a dict miss, not a ValueError.
+_EVENT_TYPES = {e.value: e for e in EventType}
+_AGENT_STATUSES = {s.value: s for s in AgentStatus}
+_EVENT_TYPE_VALUES = list(_EVENT_TYPES)
+_STATUS_VALUES = list(_AGENT_STATUSES)
 
 
 def derive_port(project_dir: str) -> int:
@@ -202,24 +212,42 @@ def _relay_event(relay: OTelRelay, event: Event) -> None:
         logger.warning("OTel relay failed for %s", event.event_type, exc_info=True)
 
 
+def _lookup(members: dict, value: Any) -> Any:
+    """Return the enum member for a wire value, or None if it is not one."""
+    return members.get(value) if isinstance(value, str) else None
+
+
+async def _read_json_body(request: Request) -> Any:
+    """Parse the request body as JSON, off the event loop when it is large.
+
+    Small hook payloads parse inline; a large ``metadata`` blob is handed to
+    a thread so it does not stall other requests while it parses.
+    """
+    raw = await request.body()
+    if len(raw) < THREADED_PARSE_BYTES:
+        return json.loads(raw)
+    return await asyncio.to_thread(json.loads, raw)
+
+
 async def receive_event(request: Request) -> JSONResponse:
     """POST /api/events -- ingest a pipeline event."""
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
     except Exception:
         return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
 
     if "event_type" not in body:
         return JSONResponse({"error": "Missing required field: event_type"}, status_code=400)
 
-    try:
-        event_type = EventType(body["event_type"])
-    except ValueError:
-        valid = [e.value for e in EventType]
-        return JSONResponse(
-            {"error": f"Invalid event_type: {body['event_type']}. Valid types: {valid}"},
-            status_code=400,
-        )
+    event_type = _lookup(_EVENT_TYPES, body["event_type"])
+    if event_type is None:
+        error = f"Invalid event_type: {body['event_type']}. Valid types: {_EVENT_TYPE_VALUES}"
+        return JSONResponse({"error": error}, status_code=400)
+
+    status = _lookup(_AGENT_STATUSES, body.get("status", "running"))
+    if status is None:
+        error = f"Invalid status: {body['status']}. Valid statuses: {_STATUS_VALUES}"
+        return JSONResponse({"error": error}, status_code=400)
 
     # Extract git context from metadata for first-class fields
     meta = body.get("metadata", {})
@@ -234,7 +262,7 @@ async def receive_event(request: Request) -> JSONResponse:
         phase=body.get("phase", 0),
         total_phases=body.get("total_phases", 0),
         phase_name=body.get("phase_name", ""),
-        status=AgentStatus(body.get("status", "running")),
+        status=status,
         message=body.get("message", ""),
         labels=body.get("labels", {}),
         metadata=meta,
@@ -261,7 +289,7 @@ async def receive_event(request: Request) -> JSONResponse:
 async def receive_interaction(request: Request) -> JSONResponse:
     """POST /api/interactions -- record a pipeline interaction."""
     try:
-        body = await request.json()
+        body = await _read_json_body(request)
     except Exception:
         return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
 
@@ -285,10 +313,29 @@ async def receive_interaction(request: Request) -> JSONResponse:
     return JSONResponse({"interaction_id": interaction_id}, status_code=201)
 
 
-async def pipeline_state(request: Request) -> JSONResponse:
-    """GET /api/state -- return full pipeline summary."""
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): any listed tag, or ``*``."""
+    opaque = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+async def pipeline_state(request: Request) -> Response:
+    """GET /api/state -- return full pipeline summary.
+
+    The store encodes the summary once per state change, so repeated polls
+    reuse the same bytes. Tagged with an ETag from the store's state
+    version; a poll whose If-None-Match still matches gets 304 and no body.
+    """
     store: EventStore = request.app.state.store
-    return JSONResponse(store.get_pipeline_summary())
+    version, body = store.get_pipeline_summary_json()
+    etag = f'W/"{version}"'
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 async def phoenix_redirect(request: Request) -> RedirectResponse:
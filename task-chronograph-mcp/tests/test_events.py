@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime
 
 from task_chronograph_mcp.events import (
@@ -56,6 +57,19 @@ class TestEventSerialization:
         assert isinstance(d["event_type"], str)
         assert isinstance(d["status"], str)
 
+    def test_to_dict_returns_independent_copies(self, sample_event: Event):
+        first = sample_event.to_dict()
+        first["message"] = "changed"
+        first["labels"]["feature"] = "changed"
+        second = sample_event.to_dict()
+        assert second["message"] == sample_event.message
+        assert second["labels"] == {"feature": "auth"}
+
+    def test_cached_dict_does_not_affect_equality(self, sample_event: Event):
+        copy = Event(**{f: getattr(sample_event, f) for f in sample_event.__dataclass_fields__})
+        sample_event.to_dict()
+        assert copy == sample_event
+
 
 # ---------------------------------------------------------------------------
 # Interaction model
@@ -101,6 +115,10 @@ class TestInteractionSerialization:
         d = interaction.to_dict()
         assert d["interaction_type"] == "novel_kind"
 
+    def test_to_dict_returns_independent_copies(self, sample_interaction: Interaction):
+        sample_interaction.to_dict()["labels"]["priority"] = "low"
+        assert sample_interaction.to_dict()["labels"] == {"priority": "high"}
+
 
 # ---------------------------------------------------------------------------
 # EventStore: add and agent state
@@ -303,6 +321,26 @@ class TestEventStoreInteractions:
         agent = event_store.get_pipeline_summary()["agents"]["researcher"]
         assert agent["task_summary"] == "Audit database schema"
 
+    async def test_earliest_pending_delegation_wins(self, event_store: EventStore):
+        """With several delegations to a not-yet-started agent, the first one applies."""
+        for source, summary in (("main_agent", "First task"), ("planner", "Second task")):
+            event_store.add_interaction(
+                Interaction(
+                    source=source,
+                    target="researcher",
+                    summary=summary,
+                    interaction_type="delegation",
+                )
+            )
+
+        event_store.add(
+            Event(event_type=EventType.AGENT_START, agent_type="researcher", agent_id="researcher")
+        )
+
+        agent = event_store.get_pipeline_summary()["agents"]["researcher"]
+        assert agent["delegation_parent"] == "main_agent"
+        assert agent["task_summary"] == "First task"
+
     async def test_delegation_without_agent_start(self, event_store: EventStore):
         """Delegation for an agent that never starts -- interaction in timeline, no corrupted state."""
         delegation = Interaction(
@@ -402,6 +440,45 @@ class TestDelegationChain:
         assert len(chain) == 1
         assert chain[0]["parent"] == "main_agent"
 
+    async def test_evicted_delegation_no_longer_applies_to_late_agent(self):
+        store = EventStore(max_interactions=2)
+        for source, target in [("main_agent", "researcher"), ("architect", "researcher")]:
+            store.add_interaction(
+                Interaction(
+                    source=source,
+                    target=target,
+                    summary=f"from {source}",
+                    interaction_type="delegation",
+                )
+            )
+        store.add_interaction(
+            Interaction(source="user", target="main_agent", summary="q", interaction_type="query")
+        )
+        store.add(Event(event_type=EventType.AGENT_START, agent_type="researcher"))
+
+        agent = store.get_pipeline_summary()["agents"]["researcher"]
+        assert agent["delegation_parent"] == "architect"
+        assert agent["task_summary"] == "from architect"
+
+        for i in range(2):
+            store.add_interaction(
+                Interaction(source="u", target=f"t{i}", summary="q", interaction_type="query")
+            )
+        assert store._delegations_to == {}
+
+    async def test_delegation_chain_follows_interaction_eviction(self):
+        store = EventStore(max_interactions=2)
+        for target, kind in [("a", "delegation"), ("b", "query"), ("c", "delegation")]:
+            store.add_interaction(
+                Interaction(source="main_agent", target=target, summary="x", interaction_type=kind)
+            )
+        assert [d["child"] for d in store.get_delegation_chain()] == ["c"]
+
+        store.add_interaction(
+            Interaction(source="main_agent", target="d", summary="x", interaction_type="query")
+        )
+        assert [d["child"] for d in store.get_delegation_chain()] == ["c"]
+
 
 # ---------------------------------------------------------------------------
 # EventStore: subscribe / unsubscribe
@@ -452,6 +529,22 @@ class TestSubscription:
         assert received.event_type == EventType.TOOL_USE
         assert "interaction:delegation:researcher" in received.message
 
+    async def test_full_subscriber_drops_oldest_without_blocking_others(
+        self, event_store: EventStore, monkeypatch
+    ):
+        monkeypatch.setattr("task_chronograph_mcp.events.SUBSCRIBER_QUEUE_SIZE", 2)
+        stalled = event_store.subscribe()
+        monkeypatch.setattr("task_chronograph_mcp.events.SUBSCRIBER_QUEUE_SIZE", 10)
+        healthy = event_store.subscribe()
+
+        for i in range(5):
+            event_store.add(Event(event_type=EventType.TOOL_USE, agent_type=f"agent-{i}"))
+        await asyncio.sleep(0)
+
+        assert stalled.qsize() == 2
+        assert [(await stalled.get()).agent_type for _ in range(2)] == ["agent-3", "agent-4"]
+        assert healthy.qsize() == 5
+
 
 # ---------------------------------------------------------------------------
 # EventStore: pipeline summary
@@ -484,6 +577,67 @@ class TestPipelineSummary:
         assert summary["event_count"] == 1
         assert len(summary["recent_events"]) == 1
 
+    async def test_summary_reflects_state_changes(
+        self, event_store: EventStore, sample_event: Event
+    ):
+        first = event_store.get_pipeline_summary()
+
+        event_store.add(sample_event)
+        after_event = event_store.get_pipeline_summary()
+        assert after_event is not first
+        assert after_event["event_count"] == 1
+
+        event_store.add_interaction(
+            Interaction(source="a", target="b", summary="s", interaction_type="handoff")
+        )
+        assert len(event_store.get_pipeline_summary()["interactions"]) == 1
+
+    async def test_summary_built_once_per_state(
+        self, event_store: EventStore, sample_event: Event, monkeypatch
+    ):
+        builds = []
+        original = event_store._build_pipeline_summary
+
+        def counting_build() -> dict:
+            builds.append(1)
+            return original()
+
+        monkeypatch.setattr(event_store, "_build_pipeline_summary", counting_build)
+        event_store.get_pipeline_summary()
+        event_store.get_pipeline_summary()
+        event_store.get_pipeline_summary_json()
+        assert len(builds) == 1
+
+        event_store.add(sample_event)
+        event_store.get_pipeline_summary()
+        assert len(builds) == 2
+
+    async def test_mutating_summary_does_not_leak_into_later_ones(
+        self, event_store: EventStore, sample_event: Event
+    ):
+        event_store.add(sample_event)
+        summary = event_store.get_pipeline_summary()
+        summary["recent_events"][0]["labels"]["feature"] = "changed"
+        summary["agents"].clear()
+
+        again = event_store.get_pipeline_summary()
+        assert again["recent_events"][0]["labels"] == {"feature": "auth"}
+        assert len(again["agents"]) == 1
+        assert event_store.get_events_by_agent("researcher")[0]["labels"] == {"feature": "auth"}
+
+    async def test_summary_json_encoded_once_per_version(
+        self, event_store: EventStore, sample_event: Event
+    ):
+        version, body = event_store.get_pipeline_summary_json()
+        assert event_store.get_pipeline_summary_json() == (version, body)
+        assert event_store.get_pipeline_summary_json()[1] is body
+        assert json.loads(body) == event_store.get_pipeline_summary()
+
+        event_store.add(sample_event)
+        new_version, new_body = event_store.get_pipeline_summary_json()
+        assert new_version != version
+        assert json.loads(new_body)["event_count"] == 1
+
 
 # ---------------------------------------------------------------------------
 # EventStore: get_events_by_agent with label filtering
@@ -491,6 +645,19 @@ class TestPipelineSummary:
 
 
 class TestGetEventsByAgent:
+    async def test_evicted_events_leave_agent_index(self):
+        store = EventStore(max_events=3)
+        for i, agent in enumerate(["researcher", "architect", "researcher", "architect"]):
+            store.add(Event(event_type=EventType.PHASE_TRANSITION, agent_type=agent, phase=i))
+
+        assert [e["phase"] for e in store.get_events_by_agent("researcher")] == [2]
+        assert [e["phase"] for e in store.get_events_by_agent("architect")] == [1, 3]
+
+        store.add(Event(event_type=EventType.PHASE_TRANSITION, agent_type="architect", phase=4))
+        store.add(Event(event_type=EventType.PHASE_TRANSITION, agent_type="architect", phase=5))
+        assert store.get_events_by_agent("researcher") == []
+        assert "researcher" not in store._events_by_agent
+
     async def test_filters_by_agent_type(self, event_store: EventStore):
         e1 = Event(event_type=EventType.AGENT_START, agent_type="researcher")
         e2 = Event(event_type=EventType.AGENT_START, agent_type="architect")
@@ -513,6 +680,20 @@ class TestGetEventsByAgent:
         results = event_store.get_events_by_agent("researcher", limit=3)
         assert len(results) == 3
 
+    async def test_limit_keeps_newest_label_matches_in_order(self, event_store: EventStore):
+        for i in range(10):
+            event_store.add(
+                Event(
+                    event_type=EventType.PHASE_TRANSITION,
+                    agent_type="researcher",
+                    phase=i,
+                    labels={"parity": "even" if i % 2 == 0 else "odd"},
+                )
+            )
+
+        results = event_store.get_events_by_agent("researcher", limit=3, label="parity=even")
+        assert [e["phase"] for e in results] == [4, 6, 8]
+
     async def test_label_filter_key_value(self, event_store: EventStore):
         e1 = Event(
             event_type=EventType.AGENT_START,
@@ -589,3 +770,23 @@ class TestBoundedDeque:
         recent = summary["recent_events"]
         phases = [e["phase"] for e in recent]
         assert phases == [5, 6, 7, 8, 9]
+
+    async def test_interactions_beyond_maxlen_are_dropped(self):
+        small_store = EventStore(max_interactions=3)
+        for i in range(6):
+            small_store.add_interaction(
+                Interaction(
+                    source="main_agent",
+                    target=f"agent-{i}",
+                    summary=f"task-{i}",
+                    interaction_type="delegation",
+                )
+            )
+
+        summary = small_store.get_pipeline_summary()
+        assert [i["target"] for i in summary["interactions"]] == ["agent-3", "agent-4", "agent-5"]
+        assert [d["child"] for d in summary["delegation_chain"]] == [
+            "agent-3",
+            "agent-4",
+            "agent-5",
+        ]
@@ -9,8 +9,10 @@ import pytest
 
 from task_chronograph_mcp.events import EventStore, EventType
 from task_chronograph_mcp.file_watcher import (
+    _end_of_last_line,
     _parse_labels_and_summary,
     _parse_timestamp,
+    _read_new_lines,
     parse_progress_line,
     watch_progress_file,
 )
@@ -137,6 +139,66 @@ class TestParseTimestamp:
         assert before <= ts <= after
 
 
+# ---------------------------------------------------------------------------
+# _read_new_lines
+# ---------------------------------------------------------------------------
+
+
+class TestEndOfLastLine:
+    def test_stops_before_unterminated_tail(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("done\nhalf-writ")
+        assert _end_of_last_line(progress_file, chunk_size=3) == len("done\n")
+
+    def test_complete_file_ends_at_size(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("one\ntwo\n")
+        assert _end_of_last_line(progress_file) == progress_file.stat().st_size
+
+    def test_no_newline_starts_at_zero(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("partial")
+        assert _end_of_last_line(progress_file, chunk_size=2) == 0
+
+
+class TestReadNewLines:
+    def test_reads_only_appended_lines(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("first\n")
+        _, offset = _read_new_lines(progress_file, 0)
+
+        with progress_file.open("a") as f:
+            f.write("second\nthird\n")
+
+        lines, new_offset = _read_new_lines(progress_file, offset)
+        assert lines == ["second", "third"]
+        assert new_offset == progress_file.stat().st_size
+
+    def test_partial_line_is_left_for_next_read(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("done\nhalf")
+
+        lines, offset = _read_new_lines(progress_file, 0)
+        assert lines == ["done"]
+
+        with progress_file.open("a") as f:
+            f.write("-written\n")
+
+        lines, _ = _read_new_lines(progress_file, offset)
+        assert lines == ["half-written"]
+
+    def test_truncated_file_is_read_from_start(self, tmp_path):
+        progress_file = tmp_path / "PROGRESS.md"
+        progress_file.write_text("a long first line\nanother line\n")
+        _, offset = _read_new_lines(progress_file, 0)
+
+        progress_file.write_text("fresh\n")
+
+        lines, new_offset = _read_new_lines(progress_file, offset)
+        assert lines == ["fresh"]
+        assert new_offset == len("fresh\n")
+
+
 # ---------------------------------------------------------------------------
 # watch_progress_file
 # ---------------------------------------------------------------------------
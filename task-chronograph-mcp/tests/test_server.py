@@ -64,6 +64,19 @@ class TestReceiveEvent:
         assert resp.status_code == 400
         assert "Invalid event_type" in resp.json()["error"]
 
+    async def test_unhashable_event_type_returns_400(self, client: httpx.AsyncClient):
+        resp = await client.post("/api/events", json={"event_type": ["agent_start"]})
+        assert resp.status_code == 400
+        assert "Invalid event_type" in resp.json()["error"]
+
+    async def test_invalid_status_returns_400(self, client: httpx.AsyncClient):
+        resp = await client.post(
+            "/api/events",
+            json={"event_type": "agent_start", "agent_type": "researcher", "status": "bogus"},
+        )
+        assert resp.status_code == 400
+        assert "Invalid status" in resp.json()["error"]
+
     async def test_invalid_json_returns_400(self, client: httpx.AsyncClient):
         resp = await client.post(
             "/api/events",
@@ -73,6 +86,21 @@ class TestReceiveEvent:
         assert resp.status_code == 400
         assert "Invalid JSON" in resp.json()["error"]
 
+    async def test_large_body_is_parsed(
+        self, client: httpx.AsyncClient, sample_event_payload: dict, monkeypatch
+    ):
+        monkeypatch.setattr("task_chronograph_mcp.server.THREADED_PARSE_BYTES", 16)
+        payload = {**sample_event_payload, "metadata": {"blob": "x" * 1024}}
+        resp = await client.post("/api/events", json=payload)
+        assert resp.status_code == 201
+
+        resp = await client.post(
+            "/api/events",
+            content=b"{" + b" " * 64,
+            headers={"content-type": "application/json"},
+        )
+        assert resp.status_code == 400
+
 
 # ---------------------------------------------------------------------------
 # GET /api/state
@@ -141,6 +169,30 @@ class TestPipelineState:
         agent = resp.json()["agents"]["researcher"]
         assert agent["task_summary"] == "Research auth patterns"
 
+    async def test_unchanged_state_returns_304(
+        self, client: httpx.AsyncClient, sample_event_payload: dict
+    ):
+        first = await client.get("/api/state")
+        etag = first.headers["etag"]
+
+        again = await client.get("/api/state", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+
+        strong = etag.removeprefix("W/")
+        for header in (f'"other", {strong}', "*", f'W/"other",{etag}'):
+            resp = await client.get("/api/state", headers={"If-None-Match": header})
+            assert resp.status_code == 304, header
+
+        stale = await client.get("/api/state", headers={"If-None-Match": '"other", W/"x"'})
+        assert stale.status_code == 200
+
+        await client.post("/api/events", json=sample_event_payload)
+        changed = await client.get("/api/state", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["event_count"] == 1
+
 
 # ---------------------------------------------------------------------------
 # GET /api/events/stream (SSE)
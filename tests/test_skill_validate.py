@@ -0,0 +1,67 @@
+"""Behavioral tests for skills/skill-crafting/scripts/validate.py.
+
+The validator is a standalone script, not a package module, so it is loaded
+by file path. These tests exercise the PyYAML parse path and are skipped when
+PyYAML is not installed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytest.importorskip("yaml")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+VALIDATE_SCRIPT = PROJECT_ROOT / "skills" / "skill-crafting" / "scripts" / "validate.py"
+
+
+def _load_validate() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("skill_validate", VALIDATE_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_skill(tmp_path: Path, frontmatter: str) -> Path:
+    skill_dir = tmp_path / "demo-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(
+        f"---\n{frontmatter}---\n\n# Demo\n", encoding="utf-8"
+    )
+    return skill_dir
+
+
+def test_valid_skill_passes(tmp_path: Path) -> None:
+    validate = _load_validate()
+    skill_dir = _write_skill(
+        tmp_path,
+        "name: demo-skill\ndescription: Demo skill.\ncompatibility: Claude Code\n",
+    )
+    assert validate.validate_skill(skill_dir) == []
+
+
+def test_list_valued_description_is_rejected(tmp_path: Path) -> None:
+    validate = _load_validate()
+    skill_dir = _write_skill(tmp_path, "name: demo-skill\ndescription: [a, b]\n")
+    assert validate.validate_skill(skill_dir) == ["'description' must be a string"]
+
+
+def test_dict_valued_compatibility_is_rejected(tmp_path: Path) -> None:
+    validate = _load_validate()
+    skill_dir = _write_skill(
+        tmp_path, "name: demo-skill\ndescription: Demo skill.\ncompatibility: {x: 1}\n"
+    )
+    assert validate.validate_skill(skill_dir) == ["'compatibility' must be a string"]
+
+
+def test_invalid_yaml_reports_only_the_parse_error(tmp_path: Path) -> None:
+    validate = _load_validate()
+    skill_dir = _write_skill(tmp_path, "name: demo-skill\ndescription: a: b: c\n")
+    errors = validate.validate_skill(skill_dir)
+    assert len(errors) == 1
+    assert errors[0].startswith("Invalid YAML in frontmatter")